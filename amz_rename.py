@@ -5,7 +5,19 @@ import sys
 import re
 import os
 import csv
+import errno
+import hashlib
+import pickle
+import queue
+import threading
+import zipfile
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+
+from logic_utils import fast_copy
 
 """
 amz_rename.py
@@ -13,47 +25,224 @@ amz_rename.py
 Runs Amazon image renaming logic within the current working directory.
 
 Usage:
-    python amz_rename.py <root>
+    python amz_rename.py [--verbose] <root>
 
 Behavior:
     - Looks for 'sku2asin.csv' in the current working directory.
     - Operates on the <root> subdirectory inside the current working directory.
     - Ignores where this script physically resides.
+    - Prints warnings and a progress line; --verbose also lists every copy.
 """
 
+_NAME_RE = re.compile(r"^(.+?)\.(MAIN|PT\d{2})\.(.+)$", re.IGNORECASE)
+_ASIN_RE = re.compile(r"^[A-Z0-9]{10}$", re.IGNORECASE)
+_INVALID_WIN_CHARS = r'<>:"/\\|?*'
+# Deletes the invalid characters in one C-level pass
+_SANITIZE_TABLE = str.maketrans("", "", _INVALID_WIN_CHARS)
+
+# Verbose per-file lines are written to stdout in chunks of this many
+_LOG_CHUNK = 1000
+# Progress line refresh interval (files) when not verbose
+_PROGRESS_EVERY = 100
+# Bounds for the walk -> plan -> copy pipeline in process_root
+_WALK_QUEUE_SIZE = 1024
+_MAX_PENDING_COPIES = 256
+
+# Tuples for str.endswith on a lowered name tail (longest suffix is 5 chars)
+_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff")
+# Already-compressed formats gain nothing from DEFLATE, so zip them stored
+_STORED_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp")
+# os.link errors meaning the filesystem has no hard links (FAT/exFAT, some
+# SMB shares; Windows reports ERROR_INVALID_FUNCTION as EINVAL)
+_NO_LINK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ("EPERM", "EINVAL", "ENOSYS", "ENOTSUP", "EOPNOTSUPP", "EMLINK")
+    if hasattr(errno, name)
+)
+# Parsed sku2asin.csv mappings are pickled here across runs
+_CACHE_DIR = Path.home() / ".cache" / "amz_rename"
+# Bump whenever _read_sku2asin_csv's output changes so old pickles are ignored
+_CACHE_VERSION = 1
+
+
+def _iter_files(root: str | os.PathLike) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every file below *root* (symlinked dirs are not followed)."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.is_file():
+                    yield e
+
+
+class _FileWalker:
+    """Runs :func:`_iter_files` on a producer thread, handing entries over a bounded queue."""
+
+    _DONE = object()
+
+    def __init__(self, root: str | os.PathLike, maxsize: int = _WALK_QUEUE_SIZE):
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, args=(root,), daemon=True)
+        self._thread.start()
+
+    def _produce(self, root: str | os.PathLike) -> None:
+        try:
+            for e in _iter_files(root):
+                if not self._put(e):
+                    return
+        finally:
+            self._put(self._DONE)
+
+    def _put(self, item) -> bool:
+        # Backpressure: block while the consumer is behind, unless closed
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> Iterator[os.DirEntry]:
+        while (e := self._queue.get()) is not self._DONE:
+            yield e
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+def _load_sku2asin_csv() -> dict[str, str]:
+    """Load sku2asin.csv (must be in current working directory).
 
-def _load_sku2asin_csv(ASIN_RE) -> dict[str, str]:
-    """Load sku2asin.csv (must be in current working directory)."""
+    The parsed mapping is cached until the file's mtime or size changes, so
+    repeated runs in one process only parse it once. Treat it as read-only.
+    """
     path = Path.cwd() / "sku2asin.csv"
-    if not path.exists():
-        raise FileNotFoundError(f"Missing sku2asin.csv in {Path.cwd()}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing sku2asin.csv in {Path.cwd()}") from None
+    return _parse_sku2asin_csv(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _parse_sku2asin_csv(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    # Warm runs on an unchanged CSV skip parsing via the on-disk pickle
+    path_hash = hashlib.blake2b(path.encode("utf-8"), digest_size=8).hexdigest()
+    prefix = f"sku2asin-{path_hash}-"
+    cache_path = _CACHE_DIR / f"{prefix}v{_CACHE_VERSION}-{mtime_ns}-{size}.pkl"
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    mapping = _read_sku2asin_csv(path)
+    _write_mapping_cache(cache_path, mapping, prefix)
+    return mapping
+
+
+def _write_mapping_cache(cache_path: Path, mapping: dict[str, str], prefix: str) -> None:
+    """Best-effort atomic write of *mapping*.
+
+    Other pickles starting with *prefix* (older versions of the same CSV, or an
+    older cache format) are removed.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(mapping, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache_path)
+        for old in cache_path.parent.glob(f"{prefix}*.pkl"):
+            if old != cache_path:
+                old.unlink(missing_ok=True)
+    except OSError:
+        # A read-only or missing home directory just means no warm start
+        pass
+
+
+def _read_sku2asin_csv(path: str) -> dict[str, str]:
     mapping: dict[str, str] = {}
-    with path.open(encoding="utf-8-sig", newline="") as f:
-        r = csv.DictReader(f)
-        if not r.fieldnames:
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        # Plain csv.reader + column indices: DictReader builds a dict per row,
+        # which dominates load time on large exports.
+        r = csv.reader(f)
+        header = next(r, None)
+        if not header:
             raise ValueError("sku2asin.csv missing header row.")
-        headers = {h.lower(): h for h in r.fieldnames}
+        headers = {h.strip().lower(): i for i, h in enumerate(header)}
         if "sku" not in headers or "asin" not in headers:
             raise ValueError("sku2asin.csv must have 'sku' and 'asin' columns.")
-        sku_col, asin_col = headers["sku"], headers["asin"]
+        sku_idx, asin_idx = headers["sku"], headers["asin"]
+        min_len = max(sku_idx, asin_idx) + 1
+        match_asin = _ASIN_RE.match
         for row in r:
-            sku = (row.get(sku_col) or "").strip().lower()
-            asin = (row.get(asin_col) or "").strip().upper()
-            if sku and ASIN_RE.match(asin):
+            if len(row) < min_len:
+                continue
+            sku = row[sku_idx].strip().lower()
+            asin = row[asin_idx].strip().upper()
+            if sku and match_asin(asin):
                 mapping[sku] = asin
+    # Folder-derived SKUs can't contain '/', so they use '-' instead. Add the
+    # hyphenated alias up front (explicit rows win) so lookups are one probe.
+    # Keys that already contain '-' could never be reached via the old
+    # '-' -> '/' fallback, so they get no alias.
+    for key, asin in list(mapping.items()):
+        if "/" in key and "-" not in key:
+            mapping.setdefault(key.replace("/", "-"), asin)
     return mapping
 
 
+@lru_cache(maxsize=4096)
 def sanitize_for_windows(name: str) -> str:
-    INVALID_WIN_CHARS = r'<>:"/\\|?*'
-    name = re.sub(f"[{re.escape(INVALID_WIN_CHARS)}]", "", name)
-    name = re.sub(r"\s+", " ", name).strip()
-    return name
+    # split()/join collapses runs of whitespace and strips the ends
+    return " ".join(name.translate(_SANITIZE_TABLE).split())
+
+
+def should_rename(entry: Path | os.DirEntry) -> bool:
+    """True for image files; accepts a Path or a DirEntry from :func:`_iter_files`."""
+    name = entry.name
+    # Only the 5-char tail is lowered; a bare '.jpg' has no stem, like Path.suffix
+    return (
+        name[-5:].lower().endswith(_EXTENSIONS)
+        and name.rfind(".") > 0
+        and entry.is_file()
+    )
 
 
-def should_rename(file_path: Path) -> bool:
-    EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff"}
-    return file_path.is_file() and file_path.suffix.lower() in EXTENSIONS
+def _rename_noreplace(src: Path, target: Path) -> bool:
+    """Rename *src* to *target* unless *target* exists; False if it does.
+
+    A hard link fails atomically when the target exists, so there is no
+    separate exists() probe and no window for another writer to slip in.
+    Filesystems without hard links fall back to check-then-replace. If the
+    source cannot be removed afterwards, the new link is dropped again and
+    the error re-raised, so a failure never leaves both names behind.
+    """
+    try:
+        os.link(src, target)
+    except FileExistsError:
+        return False
+    except OSError as e:
+        if e.errno not in _NO_LINK_ERRNOS:
+            raise
+        if target.exists():
+            return False
+        os.replace(src, target)
+        return True
+    try:
+        os.unlink(src)
+    except OSError:
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        raise
+    return True
 
 
 def rename_in_place(file_path: Path, sku: str) -> bool:
@@ -62,17 +251,24 @@ def rename_in_place(file_path: Path, sku: str) -> bool:
     if file_path.name == new_name:
         return False
     target = file_path.with_name(new_name)
-    if target.exists():
+    if not _rename_noreplace(file_path, target):
         print(f"⚠️  Skipping (target exists): {target}")
         return False
-    os.replace(file_path, target)
     print(f"Renamed: {file_path.name} -> {new_name}")
     return True
 
 
 def derive_sku_from_file(file_path: Path, root: Path) -> str:
-    # Get the 4 folders up from the file (excluding the file itself)
-    rel_parts = list(file_path.relative_to(root).parts[:-1])
+    # Get the folders above the file (excluding the file itself); every
+    # sibling in a folder shares the same SKU, so cache on the folder parts.
+    # *root* is known to be a prefix, so slice it off instead of relative_to()
+    rel_dir = os.fspath(file_path)[len(os.fspath(root)) + 1:].rpartition(os.sep)[0]
+    return _sku_from_parts(tuple(rel_dir.split(os.sep)) if rel_dir else ())
+
+
+@lru_cache(maxsize=4096)
+def _sku_from_parts(parts: tuple[str, ...]) -> str:
+    rel_parts = list(parts)
     # Always use exactly 4 parts, pad with empty strings if needed
     if len(rel_parts) < 4:
         sku_parts = rel_parts + [''] * (4 - len(rel_parts))
@@ -81,49 +277,86 @@ def derive_sku_from_file(file_path: Path, root: Path) -> str:
     return sanitize_for_windows(" ".join(sku_parts))
 
 
+def _variant_at(name: str, start: int) -> int:
+    """Index of the dot closing a 'MAIN.' / 'PTxx.' token at *start*, or -1."""
+    token = name[start:start + 5].upper()
+    if token == "MAIN.":
+        return start + 4
+    if token[:2] == "PT" and token[2:4].isdecimal() and len(token) == 5 and token[4] == ".":
+        return start + 4
+    return -1
+
+
+def _parse_variant(name: str) -> tuple[str, str] | None:
+    """Return (variant, ext) for 'SKU.VARIANT.ext', 'PTxx.ext' or 'MAIN.ext' names.
+
+    Hand-rolled equivalent of matching _NAME_RE, then 'PTxx.ext', then
+    'MAIN.ext'; plain str scans are several times faster than the regexes.
+    """
+    # SKU.VARIANT.ext: the first '.MAIN.'/'.PTxx.' after a non-empty SKU
+    dot = name.find(".", 1)
+    while dot != -1:
+        end = _variant_at(name, dot + 1)
+        if end != -1 and end + 1 < len(name):
+            return name[dot + 1:end].upper(), name[end + 1:]
+        dot = name.find(".", dot + 1)
+    # PTxx.ext / MAIN.ext (no SKU prefix)
+    end = _variant_at(name, 0)
+    if end != -1 and end + 1 < len(name):
+        variant = name[:end].upper()
+        if variant == "MAIN":
+            return variant, name.rpartition(".")[2]
+        return variant, name[end + 1:]
+    return None
+
+
+def _is_asin_named(name: str) -> bool:
+    """Cheap check for 'ASIN.MAIN.ext' / 'ASIN.PTxx.ext' (ASIN = 10 ASCII alnum chars)."""
+    if len(name) < 16 or name[10] != "." or not (name[:10].isascii() and name[:10].isalnum()):
+        return False
+    variant = name[11:16].upper()
+    return variant == "MAIN." or (variant[:2] == "PT" and variant[2:4].isdigit() and variant[4] == ".")
+
+
 def sku2asin_rename(root: Path) -> int:
     """Second pass: rename 'SKU.VARIANT.ext' -> 'ASIN.VARIANT.ext' using sku2asin.csv."""
-    NAME_RE = re.compile(r"^(.+?)\.(MAIN|PT\d{2})\.(.+)$", re.IGNORECASE)
-    ASIN_RE = re.compile(r"^[A-Z0-9]{10}$", re.IGNORECASE)
-
     try:
-        sku2asin = _load_sku2asin_csv(ASIN_RE)
+        sku2asin = _load_sku2asin_csv()
     except Exception as e:
         print(f"⚠️  {e}")
         return 0
 
     renamed = 0
-    for f in root.rglob("*"):
-        if not f.is_file():
+    match_name, match_asin = _NAME_RE.match, _ASIN_RE.match
+    for e in _iter_files(root):
+        # Already-renamed files ('ASIN.VARIANT.ext') are the common case on
+        # re-runs; spot them with plain string checks before any regex work.
+        if _is_asin_named(e.name):
             continue
 
-        m = NAME_RE.match(f.name)
+        m = match_name(e.name)
         if not m:
             continue
 
         current_id, variant, ext = m.group(1).lower(), m.group(2).upper(), m.group(3)
 
         # Skip if already ASIN
-        if ASIN_RE.match(current_id):
+        if match_asin(current_id):
             continue
 
         # Look up ASIN by SKU
         asin = sku2asin.get(current_id)
-        if not asin:
-            alt_key = current_id.replace("-", "/")
-            asin = sku2asin.get(alt_key)
-
         if not asin:
             # Nothing found in mapping
             continue
 
+        f = Path(e.path)
         new_name = f"{asin}.{variant}.{ext}"
         target = f.with_name(new_name)
-        if target.exists():
+        if not _rename_noreplace(f, target):
             print(f"⚠️  Skipping (target exists): {target.name}")
             continue
 
-        os.replace(f, target)
         print(f"Renamed (ASIN): {f.name} -> {new_name}")
         renamed += 1
 
@@ -131,8 +364,11 @@ def sku2asin_rename(root: Path) -> int:
 
 
 
-def process_root(root: str | Path) -> str:
-    """Walk all files under *root* (relative to CWD) and rename them."""
+def process_root(root: str | Path, *, verbose: bool = False) -> str:
+    """Walk all files under *root* (relative to CWD) and rename them.
+
+    Only warnings and a summary are printed unless *verbose* is set.
+    """
     root_path = Path(root) if Path(root).is_absolute() else Path.cwd() / root
     if not root_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {root_path}")
@@ -149,57 +385,79 @@ def process_root(root: str | Path) -> str:
     output_root = script_dir / "Outputs" / f"{timestamp}_Renamed"
     output_root.mkdir(parents=True, exist_ok=True)
 
-    total = 0
-    # Load ASIN mapping once
-    NAME_RE = re.compile(r"^(.+?)\.(MAIN|PT\d{2})\.(.+)$", re.IGNORECASE)
-    ASIN_RE = re.compile(r"^[A-Z0-9]{10}$", re.IGNORECASE)
+    # Start walking the tree now so it overlaps the CSV parse
+    walker = _FileWalker(root_path)
+    # Closed on every exit so a failed run never strands the producer thread
     try:
-        sku2asin = _load_sku2asin_csv(ASIN_RE)
-    except Exception as e:
-        print(f"⚠️  {e}")
-        return ""
-
-    for file_path in root_path.rglob("*"):
-        if not should_rename(file_path):
-            continue
-        sku = derive_sku_from_file(file_path, root_path)
-        if not sku:
-            print(f"⚠️  Could not derive SKU for: {file_path}")
-            continue
-        # Determine variant from filename
-        m = NAME_RE.match(file_path.name)
-        if m:
-            variant = m.group(2).upper()
-            ext = m.group(3)
-        else:
-            # Try to match PTxx.jpg pattern (no SKU prefix)
-            pt_match = re.match(r"^(PT\d{2})\.(.+)$", file_path.name, re.IGNORECASE)
-            if pt_match:
-                variant = pt_match.group(1).upper()
-                ext = pt_match.group(2)
-            # Try to match MAIN.ext pattern
-            elif re.match(r"^MAIN\.(.+)$", file_path.name, re.IGNORECASE):
-                variant = "MAIN"
-                ext = file_path.suffix.lstrip(".")
-            else:
-                print(f"⚠️  Could not parse variant for: {file_path.name}")
-                continue
-        # Lookup ASIN
-        asin = sku2asin.get(sku.lower())
-        if not asin:
-            alt_key = sku.lower().replace("-", "/")
-            asin = sku2asin.get(alt_key)
-        if not asin:
-            print(f"⚠️  No ASIN found for SKU: {sku}")
-            continue
-        target_name = f"{asin}.{variant}.{ext}"
-        rel_path = file_path.relative_to(root_path)
-        target_path = output_root / rel_path.parent / target_name
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        import shutil
-        shutil.copy2(file_path, target_path)
-        print(f"Copied: {file_path} -> {target_path}")
-        total += 1
+        # Load ASIN mapping once
+        try:
+            sku2asin = _load_sku2asin_csv()
+        except Exception as e:
+            print(f"⚠️  {e}")
+            return ""
+
+        # Copies are I/O bound; threads overlap the read/write syscalls. Each file
+        # is submitted as soon as it is planned, with a cap on pending copies.
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        pending = threading.BoundedSemaphore(_MAX_PENDING_COPIES)
+        made_dirs: dict[str, Path] = {}
+        # Entries from the walk all start with root + sep; slice that off
+        # rather than building a Path and calling relative_to() per file.
+        root_len = len(os.fspath(root_path)) + 1
+        sep = os.sep
+        copies = []
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            # Single visit per file: variant from the name, SKU from the folders,
+            # ASIN lookup, then queue the copy into the output tree.
+            for entry in walker:
+                if not should_rename(entry):
+                    continue
+                parsed = _parse_variant(entry.name)
+                if parsed is None:
+                    print(f"⚠️  Could not parse variant for: {entry.name}")
+                    continue
+                variant, ext = parsed
+                file_path = entry.path
+                rel_dir = file_path[root_len:].rpartition(sep)[0]
+                sku = _sku_from_parts(tuple(rel_dir.split(sep)) if rel_dir else ())
+                if not sku:
+                    print(f"⚠️  Could not derive SKU for: {file_path}")
+                    continue
+                # Lookup ASIN
+                asin = sku2asin.get(sku.lower())
+                if not asin:
+                    print(f"⚠️  No ASIN found for SKU: {sku}")
+                    continue
+                target_name = f"{asin}.{variant}.{ext}"
+                # Create folders on this thread so copy workers never race on mkdir
+                target_dir = made_dirs.get(rel_dir)
+                if target_dir is None:
+                    target_dir = made_dirs[rel_dir] = output_root / rel_dir
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                pending.acquire()
+                fut = ex.submit(fast_copy, file_path, target_dir / target_name)
+                fut.add_done_callback(lambda _f: pending.release())
+                copies.append((file_path, fut))
+
+            total = 0
+            log: list[str] = []
+            for src, fut in copies:
+                dst = fut.result()
+                total += 1
+                if verbose:
+                    log.append(f"Copied: {src} -> {dst}\n")
+                    if len(log) >= _LOG_CHUNK:
+                        sys.stdout.write("".join(log))
+                        log.clear()
+                elif total % _PROGRESS_EVERY == 0 or total == len(copies):
+                    sys.stdout.write(f"\rProcessed {total}/{len(copies)}")
+                    sys.stdout.flush()
+    finally:
+        walker.close()
+    if log:
+        sys.stdout.write("".join(log))
+    elif copies and not verbose:
+        sys.stdout.write("\n")
     print(f"🎯 Finished. Total files copied: {total}")
     
     # Create zip archives if files were copied
@@ -214,7 +472,6 @@ def create_zip_archives(output_root: Path) -> None:
     Create 1GB zip archives from the Renamed output folder.
     Splits files into the fewest number of 1GB groupings.
     """
-    import zipfile
     from datetime import datetime
     
     MAX_ZIP_SIZE = 1 * 1024 * 1024 * 1024  # 1GB in bytes
@@ -223,45 +480,26 @@ def create_zip_archives(output_root: Path) -> None:
     
     # Collect all files with their sizes
     files_with_sizes = []
-    for file_path in output_root.rglob("*"):
-        if file_path.is_file():
-            try:
-                size = file_path.stat().st_size
-                files_with_sizes.append((file_path, size))
-            except OSError:
-                continue
+    for entry in _iter_files(output_root):
+        try:
+            files_with_sizes.append((Path(entry.path), entry.stat().st_size))
+        except OSError:
+            continue
     
     if not files_with_sizes:
         print("No files to zip.")
         return
     
-    # Sort by size (largest first) for better packing
-    files_with_sizes.sort(key=lambda x: x[1], reverse=True)
-    
-    # Group files into bins using first-fit-decreasing algorithm
-    bins = []
-    bin_sizes = []
-    
-    for file_path, size in files_with_sizes:
-        # Try to fit in an existing bin
-        placed = False
-        for i, bin_size in enumerate(bin_sizes):
-            if bin_size + size <= MAX_ZIP_SIZE:
-                bins[i].append((file_path, size))
-                bin_sizes[i] += size
-                placed = True
-                break
-        
-        # Create new bin if needed
-        if not placed:
-            bins.append([(file_path, size)])
-            bin_sizes.append(size)
+    bins = _pack_bins(files_with_sizes, MAX_ZIP_SIZE)
     
     # Create zip files in the Outputs folder (same level as Renamed folder)
     zip_dir = output_root.parent
     
     print(f"\n📦 Creating {len(bins)} zip archive(s)...")
     
+    # Bins have disjoint inputs, so write them concurrently (zlib releases
+    # the GIL while compressing, and stored members are pure I/O)
+    jobs = []
     for idx, bin_files in enumerate(bins, start=1):
         zip_name = f"{timestamp}_part{idx}.zip"
         zip_path = zip_dir / zip_name
@@ -270,28 +508,64 @@ def create_zip_archives(output_root: Path) -> None:
         size_mb = total_size / (1024 * 1024)
         
         print(f"Creating {zip_name} ({size_mb:.1f} MB, {len(bin_files)} files)...")
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file_path, _ in bin_files:
-                # Preserve directory structure relative to the Renamed folder
-                arcname = file_path.relative_to(output_root)
-                zf.write(file_path, arcname)
-        
-        print(f"✓ Created: {zip_path}")
+        jobs.append((zip_path, bin_files))
+    
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+        for zip_path in ex.map(lambda job: _write_zip(job[0], job[1], output_root), jobs):
+            print(f"✓ Created: {zip_path}")
     
     print(f"\n✅ All archives created in: {zip_dir}")
     print(f"   Source folder: {output_root}")
 
 
+def _pack_bins(files_with_sizes: list[tuple[Path, int]], capacity: int) -> list[list[tuple[Path, int]]]:
+    """
+    Group (path, size) pairs into bins of at most *capacity* bytes using
+    best-fit-decreasing. Free space is kept in a sorted list so finding the
+    tightest bin is a bisect rather than a scan over every bin.
+    Files larger than *capacity* get a bin of their own.
+    """
+    bins: list[list[tuple[Path, int]]] = []
+    free: list[tuple[int, int]] = []  # sorted (remaining capacity, bin index)
+    for item in sorted(files_with_sizes, key=lambda x: x[1], reverse=True):
+        size = item[1]
+        i = bisect_left(free, (size, -1))
+        if i < len(free):
+            remaining, b = free.pop(i)
+            bins[b].append(item)
+            insort(free, (remaining - size, b))
+        else:
+            bins.append([item])
+            insort(free, (capacity - size, len(bins) - 1))
+    return bins
+
+
+def _write_zip(zip_path: Path, bin_files: list[tuple[Path, int]], output_root: Path) -> Path:
+    """Write one zip archive containing *bin_files*; returns *zip_path*."""
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1) as zf:
+        for file_path, _ in bin_files:
+            # Preserve directory structure relative to the Renamed folder
+            arcname = file_path.relative_to(output_root)
+            if file_path.name[-5:].lower().endswith(_STORED_SUFFIXES):
+                zf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(file_path, arcname)
+    return zip_path
+
+
 run = process_root
 
 
 def main() -> None:
-    if len(sys.argv) < 2:
-        print("Usage: python amz_rename.py <root>")
+    # The flag may come before or after <root>
+    flags = ("--verbose", "-v")
+    verbose = any(a in flags for a in sys.argv[1:])
+    args = [a for a in sys.argv[1:] if a not in flags]
+    if not args:
+        print("Usage: python amz_rename.py [--verbose] <root>")
         sys.exit(1)
     try:
-        process_root(sys.argv[1])
+        process_root(args[0], verbose=verbose)
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
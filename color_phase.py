@@ -1,9 +1,10 @@
+import itertools
 import os
-import shutil
-from functools import partial
+import threading
+from functools import lru_cache
 from typing import List
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QWidget,
@@ -20,16 +21,72 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
 )
 
+import colour_sorter
 from ui_utils import (
-    IMAGE_EXTS,
     ROW_PAD_Y,
-    natural_key,
+    THUMB_SIZE,
     pastel_for_name,
     ThumbItem,
+    ThumbLoader,
     find_leaf_dirs,
-    get_output_root,
+    ThumbPrefetchJob,
+    list_images,
 )
 
+# Approximate row pitch: thumbnail + row margins/border + list spacing
+_ROW_HEIGHT = THUMB_SIZE[1] + 18 + ROW_PAD_Y
+
+# Rows further than this many viewports from view release their pixmaps
+_KEEP_VIEWPORTS = 3
+
+# Rows created per event-loop turn when a leaf needs more row widgets
+_ROW_CHUNK = 50
+
+# Rapid clone-button clicks within this window cause a single re-apply
+_APPLY_DELAY_MS = 30
+
+# Parsed once for the whole list; rows switch styles via the isClone property
+_ROW_STYLE = (
+    "QFrame#thumbRow { background-color: #ffffff; border: 1px solid #cccccc; }"
+    'QFrame#thumbRow[isClone="true"] { background-color: #fff7e6; border: 1px solid #f0c36d; }'
+)
+
+
+@lru_cache(maxsize=128)
+def _badge_style(colour: str) -> str:
+    """Style sheet for a colour badge ("" = unassigned)."""
+    background = pastel_for_name(colour) if colour else "#eeeeee"
+    return f"background-color: {background};border: 1px solid #999999; padding: 2px 6px;"
+
+
+class _SortSignals(QObject):
+    # Output folder, and the error message ("" on success)
+    finished = pyqtSignal(str, str)
+
+
+class _SortJob(QRunnable):
+    """Runs colour_sorter.run_with_map for the whole batch on a pool thread."""
+
+    def __init__(self, root: str, col_map: dict, clone_map: dict):
+        super().__init__()
+        self.root = root
+        self.col_map = col_map
+        self.clone_map = clone_map
+        self.signals = _SortSignals()
+
+    def run(self) -> None:
+        output, error = "", ""
+        try:
+            output = colour_sorter.run_with_map(
+                self.root,
+                self.col_map,
+                apply_changes=True,
+                clone_map=self.clone_map,
+            )
+        except Exception as exc:  # reported on the GUI thread
+            error = str(exc) or type(exc).__name__
+        self.signals.finished.emit(output, error)
+
 
 class ColorPhase(QWidget):
     """PyQt implementation of the colour planning phase."""
@@ -47,10 +104,31 @@ class ColorPhase(QWidget):
         self.leaf_idx = 0
         self.items: list[ThumbItem] = []
         self.row_widgets: list[QFrame] = []
+        self._prefetch_cancel: threading.Event | None = None
+        # Leaf path relative to top_dir ('/'-separated); set in _load_leaf
+        self._rel_path = ""
+        self._rel_key = ""
+        # Thumbnails decode off the GUI thread; rows waiting on one, by path
+        self.thumb_loader = ThumbLoader(self)
+        self.thumb_loader.loaded.connect(self._on_thumb_loaded)
+        self._pending_thumbs: dict[str, QFrame] = {}
+        self._rows_scheduled = False
+        self._sort_job: _SortJob | None = None
+        # Indices of rows currently holding (or loading) a thumbnail
+        self._realized_rows: set[int] = set()
+        # Clone toggles update clone_map at once but share one deferred re-apply
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(_APPLY_DELAY_MS)
+        self._apply_timer.timeout.connect(self.apply_colors)
+        # Scrolling emits a valueChanged per step; scan the rows once per event-loop turn
+        self._realize_timer = QTimer(self)
+        self._realize_timer.setSingleShot(True)
+        self._realize_timer.setInterval(0)
+        self._realize_timer.timeout.connect(self._realize_visible_thumbs)
 
         self._build_ui()
 
-        self.output_root = get_output_root(root_dir)
         if not self.leaf_dirs:
             QMessageBox.information(self, "No leaf folders", "No leaf folders with images were found.")
             self.btn_next.setEnabled(False)
@@ -92,7 +170,7 @@ class ColorPhase(QWidget):
         self.num_colors = QSpinBox()
         self.num_colors.setRange(1, 20)
         self.num_colors.setValue(3)
-        self.num_colors.valueChanged.connect(self._rebuild_entries)
+        self.num_colors.valueChanged.connect(self._resize_entries)
         cfg_layout.addWidget(self.num_colors)
 
         self.apply_button = QPushButton("Apply Order")
@@ -108,42 +186,66 @@ class ColorPhase(QWidget):
         layout.addWidget(cfg_group)
 
         self.color_entries: list[QLineEdit] = []
-        self._rebuild_entries()
+        # Entry holders are inserted above this trailing stretch
+        self.colors_layout.addStretch(1)
+        self._resize_entries(self.num_colors.value())
         self._suggest_defaults(["Black", "Brown", "Navy"])
 
         # Scroll area for thumbnails
-        scroll_area = QScrollArea()
+        self.scroll_area = scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         self.list_container = QWidget()
+        self.list_container.setStyleSheet(_ROW_STYLE)
         self.list_layout = QVBoxLayout(self.list_container)
         self.list_layout.setContentsMargins(0, 0, 0, 0)
         self.list_layout.setSpacing(ROW_PAD_Y)
+        # Rows are inserted above this trailing stretch
+        self.list_layout.addStretch(1)
         scroll_area.setWidget(self.list_container)
         layout.addWidget(scroll_area, stretch=1)
+        # Thumbnails are decoded only for rows near the viewport
+        vbar = scroll_area.verticalScrollBar()
+        # A wheel notch (3 steps by default) moves one whole row, instead of
+        # many small steps that each re-run the visible-row scan
+        vbar.setSingleStep(max(1, _ROW_HEIGHT // 3))
+        vbar.valueChanged.connect(self._schedule_realize)
+        vbar.rangeChanged.connect(self._schedule_realize)
 
         self.status = QLabel("")
         layout.addWidget(self.status)
 
     # ------------------------------------------------------------------
     def _load_leaf(self, idx: int) -> None:
+        # Stop warming the old "next" leaf before competing with it for the disk
+        self._cancel_prefetch()
         self.leaf_idx = idx
         self.dir_path = self.leaf_dirs[idx]
-        names = sorted(
-            [f for f in os.listdir(self.dir_path) if os.path.splitext(f)[1].lower() in IMAGE_EXTS],
-            key=natural_key,
-        )
+        # top_dir and dir_path are fixed for the leaf's lifetime
+        self._rel_path = os.path.relpath(self.dir_path, self.top_dir).replace("\\", "/") if self.top_dir else ""
+        self._rel_key = self._rel_path.strip("/")
+        # Drop thumbnails still in flight for the previous leaf
+        self.thumb_loader.reset()
+        self._pending_thumbs.clear()
+        names = list_images(self.dir_path)
         self.items = [ThumbItem(os.path.join(self.dir_path, f), i) for i, f in enumerate(names)]
         self.apply_colors()
         self.btn_next.setEnabled(True)
-        self._copy_to_output()
         self._refresh_status()
+        self._prefetch_leaf(idx + 1)
 
-    def _copy_to_output(self) -> None:
-        rel_path = os.path.relpath(self.dir_path, self.top_dir).replace("\\", "/")
-        output_leaf_dir = os.path.join(self.output_root, rel_path)
-        os.makedirs(output_leaf_dir, exist_ok=True)
-        for item in self.items:
-            shutil.copy2(item.path, output_leaf_dir)
+    def _prefetch_leaf(self, idx: int) -> None:
+        """Warm up leaf *idx* in the background, cancelling any earlier prefetch."""
+        self._cancel_prefetch()
+        if idx >= len(self.leaf_dirs):
+            return
+        self._prefetch_cancel = threading.Event()
+        job = ThumbPrefetchJob(self.leaf_dirs[idx], self._prefetch_cancel)
+        QThreadPool.globalInstance().start(job)
+
+    def _cancel_prefetch(self) -> None:
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
 
     def _last_two_dirs(self, path: str) -> str:
         parts = os.path.normpath(path).split(os.sep)
@@ -156,27 +258,28 @@ class ColorPhase(QWidget):
         else:
             self.lbl_dir.setText(short_path or "No folder selected")
 
-    def _clear_color_entries(self) -> None:
-        while self.colors_layout.count():
-            item = self.colors_layout.takeAt(0)
-            if widget := item.widget():
-                widget.deleteLater()
-
-    def _rebuild_entries(self) -> None:
-        self._clear_color_entries()
-        self.color_entries.clear()
-        count = max(1, min(self.num_colors.value(), 20))
-        for idx in range(count):
-            holder = QWidget()
-            holder_layout = QVBoxLayout(holder)
-            holder_layout.setContentsMargins(0, 0, 0, 0)
-            holder_layout.setSpacing(4)
-            holder_layout.addWidget(QLabel(f"{idx + 1}."))
-            entry = QLineEdit()
-            holder_layout.addWidget(entry)
-            self.color_entries.append(entry)
-            self.colors_layout.addWidget(holder)
-        self.colors_layout.addStretch(1)
+    def _resize_entries(self, count: int) -> None:
+        """Add or remove trailing colour entries; existing ones keep their text."""
+        count = max(1, min(count, 20))
+        # One repaint for the whole batch instead of one per widget
+        self.colors_frame.setUpdatesEnabled(False)
+        try:
+            while len(self.color_entries) > count:
+                self.color_entries.pop()
+                holder = self.colors_layout.takeAt(len(self.color_entries)).widget()
+                holder.deleteLater()
+            for idx in range(len(self.color_entries), count):
+                holder = QWidget()
+                holder_layout = QVBoxLayout(holder)
+                holder_layout.setContentsMargins(0, 0, 0, 0)
+                holder_layout.setSpacing(4)
+                holder_layout.addWidget(QLabel(f"{idx + 1}."))
+                entry = QLineEdit()
+                holder_layout.addWidget(entry)
+                self.color_entries.append(entry)
+                self.colors_layout.insertWidget(idx, holder)
+        finally:
+            self.colors_frame.setUpdatesEnabled(True)
 
     def _suggest_defaults(self, names: list[str]) -> None:
         for i, name in enumerate(names[: len(self.color_entries)]):
@@ -186,38 +289,69 @@ class ColorPhase(QWidget):
         return [entry.text().strip() for entry in self.color_entries if entry.text().strip()]
 
     def apply_colors(self) -> None:
+        # Supersedes any pending deferred re-apply
+        self._apply_timer.stop()
         cols = self._get_sequence()
         clone_name = self._current_clone_name()
-        seq_idx = 0
+        # The clone image sits outside the round-robin, so it doesn't advance the cycle
+        colours = itertools.cycle(cols) if cols else None
         for item in self.items:
             if clone_name and item.name == clone_name:
                 item.assigned_color = "Clone"
-            elif cols:
-                item.assigned_color = cols[seq_idx % len(cols)]
-                seq_idx += 1
             else:
-                item.assigned_color = ""
-        self._render_list()
+                item.assigned_color = next(colours) if colours else ""
+        self._sync_rows(clone_name)
         self._refresh_status(cols)
 
-    def _create_item_row(self, idx: int, item: ThumbItem) -> QFrame:
+    def _update_row(self, row: QFrame, item: ThumbItem, is_clone: bool) -> None:
+        """Refresh the colour badge and clone highlight of an existing row.
+
+        Only the parts whose state changed are touched, so re-applying colours
+        mostly leaves rows alone.
+        """
+        if row.property("isClone") != is_clone:
+            row.setProperty("isClone", is_clone)
+            # Property selectors are only re-evaluated on a re-polish
+            row.style().unpolish(row)
+            row.style().polish(row)
+            row.clone_note.setVisible(is_clone)
+            row.clone_btn.setChecked(is_clone)
+        elif row.clone_btn.isChecked() != is_clone:
+            # A click toggled the button but the clone didn't change; put it back
+            row.clone_btn.setChecked(is_clone)
+
+        if row.badge_name == item.assigned_color:
+            return
+        row.badge_name = item.assigned_color
+        row.badge_label.setText(f"  {item.assigned_color or '—'}  ")
+        # A per-widget style sheet is parsed and polished on every set, so rows
+        # away from the viewport are restyled when _realize_visible_thumbs reaches them
+        if row.thumb_loaded:
+            self._style_badge(row)
+
+    @staticmethod
+    def _style_badge(row: QFrame) -> None:
+        if row.badge_styled != row.badge_name:
+            row.badge_styled = row.badge_name
+            row.badge_label.setStyleSheet(_badge_style(row.badge_name))
+
+    def _create_item_row(self, idx: int, item: ThumbItem, clone_name: str) -> QFrame:
         row = QFrame()
         row.setFrameShape(QFrame.StyledPanel)
+        row.setObjectName("thumbRow")
+        row.item = item
 
-        is_clone = self._current_clone_name() == item.name
-        bg_colour = "#fff7e6" if is_clone else "#ffffff"
-        border_colour = "#f0c36d" if is_clone else "#cccccc"
-        row.setStyleSheet(f"background-color: {bg_colour}; border: 1px solid {border_colour};")
+        is_clone = clone_name == item.name
         row_layout = QHBoxLayout(row)
         row_layout.setContentsMargins(8, 8, 8, 8)
         row_layout.setSpacing(12)
 
-        thumb = item.load_thumb()
-        img_label = QLabel()
-        img_label.setPixmap(thumb)
-        img_label.setAlignment(Qt.AlignCenter)
-        img_label.setFixedSize(thumb.size())
-        row_layout.addWidget(img_label)
+        # Fixed-size placeholder; _realize_visible_thumbs fills in the pixmap
+        row.img_label = QLabel()
+        row.img_label.setAlignment(Qt.AlignCenter)
+        row.img_label.setFixedSize(*THUMB_SIZE)
+        row.thumb_loaded = False
+        row_layout.addWidget(row.img_label)
 
         meta = QWidget()
         meta_layout = QVBoxLayout(meta)
@@ -230,62 +364,178 @@ class ColorPhase(QWidget):
         idx_label.setFont(idx_font)
         meta_layout.addWidget(idx_label)
 
-        cname = item.assigned_color or "—"
-        badge = QLabel(f"  {cname}  ")
-        badge.setStyleSheet(
-            f"background-color: {pastel_for_name(cname) if item.assigned_color else '#eeeeee'};"
-            "border: 1px solid #999999; padding: 2px 6px;"
-        )
-        meta_layout.addWidget(badge)
-
-        meta_layout.addWidget(QLabel(os.path.basename(item.path)))
-        if is_clone:
-            clone_note = QLabel("Clone source")
-            clone_note.setStyleSheet("color: #a46900; font-style: italic;")
-            meta_layout.addWidget(clone_note)
+        row.badge_label = QLabel()
+        row.badge_name = None
+        # Colour the badge's style sheet currently shows
+        row.badge_styled = None
+        meta_layout.addWidget(row.badge_label)
+
+        row.name_label = QLabel(item.name)
+        meta_layout.addWidget(row.name_label)
+        row.clone_note = QLabel("Clone source")
+        row.clone_note.setStyleSheet("color: #a46900; font-style: italic;")
+        meta_layout.addWidget(row.clone_note)
         meta_layout.addStretch(1)
 
         row_layout.addWidget(meta, stretch=1)
-        clone_btn = QPushButton("Clone to all colours")
-        clone_btn.setCheckable(True)
-        clone_btn.setChecked(is_clone)
-        clone_btn.clicked.connect(partial(self._handle_clone_clicked, item))
-        row_layout.addWidget(clone_btn)
+        row.clone_btn = QPushButton("Clone to all colours")
+        row.clone_btn.setCheckable(True)
+        # One shared slot for every row; the button carries its row index
+        row.clone_btn.setProperty("item_idx", idx)
+        row.clone_btn.clicked.connect(self._on_clone_button_clicked)
+        row_layout.addWidget(row.clone_btn)
+        self._update_row(row, item, is_clone)
         return row
 
-    def _clear_list(self) -> None:
-        while self.list_layout.count():
-            item = self.list_layout.takeAt(0)
-            if widget := item.widget():
-                widget.deleteLater()
-        self.row_widgets.clear()
-
-    def _render_list(self) -> None:
-        self._clear_list()
-        for idx, item in enumerate(self.items):
-            row = self._create_item_row(idx, item)
-            self.list_layout.addWidget(row)
-            self.row_widgets.append(row)
-        self.list_layout.addStretch(1)
+    def _sync_rows(self, clone_name: str) -> None:
+        """Make the row widgets match self.items, reusing existing rows where possible.
+
+        Rows are position-bound: row i always shows items[i]. Surplus rows are
+        removed from the end and missing ones appended, so a same-length
+        refresh creates and destroys nothing. At most _ROW_CHUNK rows are
+        created per call; the rest follow from the event loop, so a huge leaf
+        paints its first rows without waiting for the last.
+        """
+        self._rows_scheduled = False
+        rows = self.row_widgets
+        rebound = False
+        create_limit = len(rows) + _ROW_CHUNK
+        # Batch the row mutations into a single repaint
+        self.list_container.setUpdatesEnabled(False)
+        try:
+            for idx, item in enumerate(self.items):
+                is_clone = bool(clone_name) and item.name == clone_name
+                if idx < len(rows):
+                    row = rows[idx]
+                    if row.item is not item:
+                        # A new leaf with a row already here: swap in the new image
+                        row.item = item
+                        row.name_label.setText(item.name)
+                        row.img_label.clear()
+                        row.thumb_loaded = False
+                        rebound = True
+                    self._update_row(row, item, is_clone)
+                elif idx < create_limit:
+                    row = self._create_item_row(idx, item, clone_name)
+                    self.list_layout.insertWidget(idx, row)
+                    rows.append(row)
+                    rebound = True
+                else:
+                    break
+            for row in rows[len(self.items):]:
+                self._pending_thumbs.pop(row.item.path, None)
+                row.hide()
+                self.list_layout.removeWidget(row)
+                row.deleteLater()
+            del rows[len(self.items):]
+        finally:
+            self.list_container.setUpdatesEnabled(True)
+        if rebound:
+            # Row geometry is only known after the layout pass
+            self._schedule_realize()
+        if len(rows) < len(self.items) and not self._rows_scheduled:
+            self._rows_scheduled = True
+            QTimer.singleShot(0, self._sync_remaining_rows)
+
+    def _sync_remaining_rows(self) -> None:
+        if self._rows_scheduled:
+            self._sync_rows(self._current_clone_name())
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._schedule_realize()
+
+    def _schedule_realize(self, *_args) -> None:
+        """Run _realize_visible_thumbs once the current burst of scroll/layout events is handled."""
+        if not self._realize_timer.isActive():
+            self._realize_timer.start()
+
+    def _realize_visible_thumbs(self, *_args) -> None:
+        """Request thumbnails for rows within one viewport height of the visible area.
+
+        Cached pixmaps are shown at once; the rest are decoded on the thread
+        pool and land in _on_thumb_loaded, keeping scrolling responsive. Rows
+        scrolled far away drop their pixmap again (QPixmapCache still has it),
+        so memory follows the viewport rather than the leaf size.
+        """
+        if not self.isVisible():
+            return
+        # Make sure row positions reflect any pending relayout
+        self.list_layout.activate()
+        height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        lo, hi = top - height, top + 2 * height
+        rows = self.row_widgets
+        for idx, row in enumerate(rows):
+            y = row.y()
+            if y > hi:
+                break
+            if row.thumb_loaded or y + row.height() < lo:
+                continue
+            row.thumb_loaded = True
+            self._realized_rows.add(idx)
+            self._style_badge(row)
+            pixmap = row.item.cached_thumb()
+            if pixmap is not None:
+                row.img_label.setPixmap(pixmap)
+            elif row.item.path not in self._pending_thumbs:
+                self._pending_thumbs[row.item.path] = row
+                self.thumb_loader.request(row.item.path)
+
+        far_lo, far_hi = top - _KEEP_VIEWPORTS * height, top + (_KEEP_VIEWPORTS + 1) * height
+        for idx in list(self._realized_rows):
+            row = rows[idx] if idx < len(rows) else None
+            if row is None or not row.thumb_loaded:
+                # Removed or rebound to another image since it was realized
+                self._realized_rows.discard(idx)
+            elif row.y() > far_hi or row.y() + row.height() < far_lo:
+                self._realized_rows.discard(idx)
+                self._pending_thumbs.pop(row.item.path, None)
+                row.img_label.clear()
+                row.item.thumb = None
+                row.thumb_loaded = False
+
+    def _on_thumb_loaded(self, results: list) -> None:
+        # One repaint for the whole batch
+        self.list_container.setUpdatesEnabled(False)
+        try:
+            for path, pixmap in results:
+                row = self._pending_thumbs.pop(path, None)
+                # The row may have been rebound to another image meanwhile
+                if row is None or row.item.path != path:
+                    continue
+                row.item.set_thumb(pixmap)
+                row.img_label.setPixmap(pixmap)
+        finally:
+            self.list_container.setUpdatesEnabled(True)
 
     def _current_rel_key(self) -> str:
-        if not (self.top_dir and self.dir_path):
-            return ""
-        return os.path.relpath(self.dir_path, self.top_dir).replace("\\", "/").strip("/")
+        return self._rel_key
 
     def _current_clone_name(self) -> str:
         rel = self._current_rel_key()
         return self.clone_map.get(rel, "")
 
+    @pyqtSlot(bool)
+    def _on_clone_button_clicked(self, checked: bool) -> None:
+        idx = self.sender().property("item_idx")
+        if idx is not None and 0 <= idx < len(self.items):
+            self._handle_clone_clicked(self.items[idx], checked)
+
     def _handle_clone_clicked(self, item: ThumbItem, checked: bool) -> None:
         if checked:
-            self._set_clone_item(item)
+            self._set_clone_item(item, defer=True)
         elif self._current_clone_name() == item.name:
-            self._set_clone_item(None)
+            self._set_clone_item(None, defer=True)
         else:
             self._refresh_status()
 
-    def _set_clone_item(self, item: ThumbItem | None) -> None:
+    def _set_clone_item(self, item: ThumbItem | None, defer: bool = False) -> None:
+        """Record the leaf's clone image and re-apply colours.
+
+        With *defer*, the re-apply is coalesced through _apply_timer so a
+        burst of clicks refreshes the rows once.
+        """
         rel = self._current_rel_key()
         if not rel:
             return
@@ -293,7 +543,10 @@ class ColorPhase(QWidget):
             self.clone_map.pop(rel, None)
         else:
             self.clone_map[rel] = item.name
-        self.apply_colors()
+        if defer:
+            self._apply_timer.start()
+        else:
+            self.apply_colors()
 
     def _refresh_status(self, cols: list[str] | None = None) -> None:
         cols = cols if cols is not None else self._get_sequence()
@@ -306,24 +559,14 @@ class ColorPhase(QWidget):
         self.status.setText(" • ".join(parts))
 
     def _remember_current_leaf_colors(self) -> None:
-        if not (self.top_dir and self.dir_path):
+        rel = self._rel_key
+        if not rel:
             return
-        rel = os.path.relpath(self.dir_path, self.top_dir).replace("\\", "/").strip("/")
         seq = self._get_sequence()
         if seq:
             self.col_map[rel] = seq
         elif rel in self.col_map:
             self.col_map.pop(rel, None)
-        
-        # Store which images are marked for duplication to all colors
-        dup_indices = []
-        for idx, var in enumerate(self.duplicate_all_vars):
-            if var.get():
-                dup_indices.append(idx)
-        if dup_indices:
-            self.duplicate_indices[rel] = dup_indices
-        elif rel in self.duplicate_indices:
-            self.duplicate_indices.pop(rel, None)
 
     def next_model(self) -> None:
         if not self.items:
@@ -338,17 +581,19 @@ class ColorPhase(QWidget):
 
     def _complete_batch(self) -> None:
         QMessageBox.information(self, "Batch complete", "Recorded colour sequences for all leaf folders.")
-        try:
-            import colour_sorter
-
-            colour_output = colour_sorter.run_with_map(
-                self.top_dir,
-                self.col_map,
-                apply_changes=True,
-                clone_map=self.clone_map,
-            )
-        except Exception as exc:  # pragma: no cover - defensive
-            QMessageBox.critical(self, "colour_sorter failed", str(exc))
+        # Sorting copies every image; keep the window responsive meanwhile
+        self.btn_next.setEnabled(False)
+        self.status.setText("Sorting images into colour folders…")
+        job = _SortJob(self.top_dir, dict(self.col_map), dict(self.clone_map))
+        job.signals.finished.connect(self._on_sort_done)
+        # Keep the job (and its signals object) alive until it reports back
+        self._sort_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_sort_done(self, colour_output: str, error: str) -> None:
+        self._sort_job = None
+        if error:
+            QMessageBox.critical(self, "colour_sorter failed", error)
             colour_output = self.top_dir
         if callable(self.on_complete):
             self.on_complete(colour_output)
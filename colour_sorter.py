@@ -4,12 +4,16 @@
 Minimal colour sorter — import-only.
 
 Exposes:
-    run_with_map(root, col_map, apply_changes=True, *, clone_map=None) -> str
+    run_with_map(root, col_map, apply_changes=True, *, clone_map=None, link_mode="reflink") -> str
 
 - root: str | Path to the top-level directory
 - col_map: dict[str, list[str]] where keys are leaf paths relative to root (POSIX '/')
-- apply_changes: if False, no files are moved (dry-run)
+- apply_changes: if False, nothing is written (dry-run); the returned output
+  folder is where the results would go
 - clone_map: optional dict[str, str] mapping leaf paths to image names to clone into every colour folder
+- link_mode: how images are placed in the output tree — "reflink" (copy-on-write
+  clone where the filesystem supports it, else a copy), "hardlink" (falls back to
+  reflink, then copy; later steps must not edit outputs in place) or "copy"
 
 Round-robin assigns images in each leaf folder into subfolders named by the colour
 sequence. Hidden files/folders are skipped.
@@ -17,56 +21,89 @@ sequence. Hidden files/folders are skipped.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Iterable, Optional
-import re
+import os
 import shutil
 from datetime import datetime
 
+from logic_utils import LINK_MODES, fast_copy, natural_key, place_file
+
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff"}
 INCLUDE_HIDDEN = False
+# Concurrent placements per leaf; file I/O releases the GIL
+_COPY_WORKERS = 16
 
 
-from logic_utils import natural_key
+def _is_hidden(p: Path) -> bool:
+    return _is_hidden_name(p.name)
 
 
-def _is_hidden(p: Path) -> bool:
+def _is_hidden_name(n: str) -> bool:
     if INCLUDE_HIDDEN:
         return False
-    n = p.name
-    return n.startswith(".") or n.startswith("_")
+    return n.startswith((".", "_"))
 
 
 def _iter_images(folder: Path) -> Iterable[Path]:
-    for e in sorted(folder.iterdir(), key=lambda p: natural_key(p.name)):
-        if e.is_file() and e.suffix.lower() in IMAGE_EXTS and not _is_hidden(e):
-            yield e
-
-
-def _ensure_colour_dirs(folder: Path, colours: List[str]) -> Dict[str, Path]:
-    out: Dict[str, Path] = {}
+    for path in _list_image_paths(folder):
+        yield Path(path)
+
+
+def _list_image_paths(folder: str | Path) -> List[str]:
+    """Natural-sorted image paths (as strings) directly inside *folder*."""
+    # DirEntry.is_file uses the type from readdir, so no per-file stat;
+    # the suffix test matches Path.suffix (a leading dot is not a suffix).
+    with os.scandir(folder) as it:
+        entries = [
+            (natural_key(e.name), e.path)
+            for e in it
+            if not _is_hidden_name(e.name)
+            and (dot := e.name.rfind(".")) > 0
+            and e.name[dot:].lower() in IMAGE_EXTS
+            and e.is_file()
+        ]
+    entries.sort(key=lambda t: t[0])
+    return [path for _, path in entries]
+
+
+def _ensure_colour_dirs(folder: str | Path, colours: List[str]) -> Dict[str, str]:
+    # One makedirs walks the ancestors; each colour then needs a single mkdir
+    os.makedirs(folder, exist_ok=True)
+    out: Dict[str, str] = {}
     for c in colours:
         name = c.strip()
-        if not name:
+        if not name or name in out:
             continue
-        d = folder / name
-        d.mkdir(parents=True, exist_ok=True)
+        d = os.path.join(folder, name)
+        try:
+            os.mkdir(d)
+        except FileExistsError:
+            pass
         out[name] = d
     return out
 
 
+def _new_output_root(create: bool = True) -> Path:
+    """Return Outputs/<timestamp> beside this script, creating it if *create*."""
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    output_root = Path(os.path.dirname(__file__)) / "Outputs" / timestamp
+    if create:
+        output_root.mkdir(parents=True, exist_ok=True)
+    return output_root
+
+
 def _move_round_robin(files: List[Path], colour_dirs: Dict[str, Path], order: List[str], apply: bool) -> None:
-    if not files or not order:
+    clean = [c for c in (c.strip() for c in order) if c]
+    if not files or not clean:
         return
-    k = len(order)
+    k = len(clean)
     for i, src in enumerate(files):
-        colour = order[i % k].strip()
-        if not colour:
-            continue
-        dst_dir = colour_dirs.get(colour)
+        dst_dir = colour_dirs.get(clean[i % k])
         if not dst_dir:
             continue
-        dst = dst_dir / src.name
+        dst = Path(dst_dir) / src.name
         if dst == src:
             continue
         if apply:
@@ -83,16 +120,18 @@ def _process(
     apply: bool,
     clone_map: Optional[Dict[str, str]] = None,
     output_root: Optional[Path] = None,
+    duplicate_indices: Optional[Dict[str, List[int]]] = None,
+    link_mode: str = "reflink",
 ) -> int:
     # Use provided output folder or create timestamped one
     if output_root is None:
-        import os
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        script_dir = Path(os.path.dirname(__file__))
-        output_root = script_dir / "Outputs" / timestamp
-        output_root.mkdir(parents=True, exist_ok=True)
+        output_root = _new_output_root()
     acted = 0
     clone_map = clone_map or {}
+    duplicate_indices = duplicate_indices or {}
+    # Path stays at the API boundary; the per-leaf/per-file work uses plain strings
+    root_str = str(root)
+    output_str = str(output_root)
 
     for rel, seq in col_map.items():
         rel_posix = str(rel).strip().strip("/")
@@ -102,11 +141,12 @@ def _process(
         if not colours:
             continue
 
-        folder = (root / Path(rel_posix)).resolve()
-        if not folder.is_dir():
+        # root is already resolved by run_with_map
+        folder = os.path.join(root_str, rel_posix)
+        if not os.path.isdir(folder):
             continue
 
-        files = list(_iter_images(folder))
+        files = _list_image_paths(folder)
         if not files:
             continue
 
@@ -123,32 +163,33 @@ def _process(
             else:
                 normal_files.append(f)
 
+        if not apply:
+            # Dry-run: the leaf would be sorted, but nothing is written
+            acted += 1
+            continue
+
         # Create output dirs for colours
-        out_dirs = {}
-        for c in colours:
-            name = c.strip()
-            if not name:
-                continue
-            d = output_root / rel_posix / name
-            d.mkdir(parents=True, exist_ok=True)
-            out_dirs[name] = d
+        out_dirs = _ensure_colour_dirs(os.path.join(output_str, rel_posix), colours)
 
         # Copy normal files round-robin to output dirs
         # These files get their color assignment based on their position in the FILTERED list
         # (skipping the duplicate-to-all images)
-        k = len(colours)
-        for i, src in enumerate(normal_files):
-            colour = colours[i % k].strip()
-            if not colour:
-                continue
-            dst_dir = out_dirs.get(colour)
-            if not dst_dir:
-                continue
-            dst = dst_dir / src.name
-            shutil.copy2(src, dst)
+        # colours is already stripped and non-empty, and every entry has a dir,
+        # so one list of target dirs (repeated round-robin) covers every file.
+        cycle = [out_dirs[c] for c in colours]
+        k = len(cycle)
+        targets = cycle * (len(normal_files) // k) + cycle[: len(normal_files) % k]
+        pairs = [
+            (src, os.path.join(dst_dir, os.path.basename(src)))
+            for src, dst_dir in zip(normal_files, targets)
+        ]
+        if pairs:
+            # Placements are independent, so keep many in flight at once
+            with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(pairs))) as ex:
+                list(ex.map(lambda p: place_file(p[0], p[1], link_mode), pairs))
 
         clone_name = clone_map.get(rel_posix)
-        if apply and clone_name and out_dirs:
+        if clone_name and out_dirs:
             _clone_selected_to_all_colours(out_dirs, clone_name)
         acted += 1
     return acted
@@ -160,7 +201,10 @@ def run_with_map(
     apply_changes: bool = True,
     *,
     clone_map: Optional[Dict[str, str]] = None,
+    link_mode: str = "reflink",
 ) -> str:
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"link_mode must be one of {LINK_MODES}, not {link_mode!r}")
     root_path = Path(root).resolve()
     norm: Dict[str, List[str]] = {}
     for rel, seq in col_map.items():
@@ -176,16 +220,11 @@ def run_with_map(
             if key and name:
                 clone_norm[key] = Path(str(name)).name
     # Create output folder path ONCE at the beginning
-    from datetime import datetime
-    import os
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    script_dir = Path(os.path.dirname(__file__))
-    output_root = script_dir / "Outputs" / timestamp
-    output_root.mkdir(parents=True, exist_ok=True)
-    _process(root_path, norm, bool(apply_changes), clone_norm, output_root)
+    output_root = _new_output_root(create=bool(apply_changes))
+    _process(root_path, norm, bool(apply_changes), clone_norm, output_root, link_mode=link_mode)
     return str(output_root)
 
-def _clone_selected_to_all_colours(colour_dirs: Dict[str, Path], selected_name: str) -> None:
+def _clone_selected_to_all_colours(colour_dirs: Dict[str, str | Path], selected_name: str) -> None:
     """Copy the selected image into every colour directory if missing."""
     selected_name = Path(selected_name).name
     if not selected_name:
@@ -193,8 +232,8 @@ def _clone_selected_to_all_colours(colour_dirs: Dict[str, Path], selected_name:
 
     source_path = None
     for d in colour_dirs.values():
-        candidate = d / selected_name
-        if candidate.exists():
+        candidate = os.path.join(d, selected_name)
+        if os.path.exists(candidate):
             source_path = candidate
             break
 
@@ -202,11 +241,11 @@ def _clone_selected_to_all_colours(colour_dirs: Dict[str, Path], selected_name:
         return
 
     for target_dir in colour_dirs.values():
-        dst = target_dir / selected_name
-        if dst.exists():
+        dst = os.path.join(target_dir, selected_name)
+        if os.path.exists(dst):
             continue
         try:
-            shutil.copy2(str(source_path), str(dst))
+            fast_copy(source_path, dst)
         except Exception:
             # Ignore copy failures to keep behaviour non-fatal for the UI.
             pass
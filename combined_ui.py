@@ -5,7 +5,7 @@ import os
 import subprocess
 import sys
 
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QApplication,
@@ -14,6 +14,7 @@ from PyQt5.QtWidgets import (
     QLabel,
     QMainWindow,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QFileDialog,
     QVBoxLayout,
@@ -21,21 +22,63 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from color_phase import ColorPhase
-from order_phase import OrderPhase
+from logic_utils import natural_key
 
+# The phase modules (and with them PIL, colour_sorter, pt_order and the
+# thumbnail machinery) are imported when a phase is first shown, so the start
+# menu and "Fetch sku2asin" come up without loading them.
 
-def run_front_images(root_dir: str, front_image_folder: str, parent: QWidget | None = None) -> None:
-    if not front_image_folder:
-        return
-    from front_image import copy_front_images
 
-    result = copy_front_images(front_image_folder, root_dir)
-    QMessageBox.information(
-        parent,
-        "Front Images",
-        f"Copied: {result['copied']}, Skipped: {result['skipped']}",
-    )
+class _FetchSignals(QObject):
+    # Exit code, stdout, stderr of fetch_sku2asin.py
+    finished = pyqtSignal(int, str, str)
+
+
+class _FetchJob(QRunnable):
+    """Runs fetch_sku2asin.py (network bound) on a pool thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _FetchSignals()
+
+    def run(self) -> None:
+        try:
+            result = subprocess.run([sys.executable, "fetch_sku2asin.py"], capture_output=True, text=True)
+            code, out, err = result.returncode, result.stdout, result.stderr
+        except OSError as exc:
+            code, out, err = -1, "", str(exc)
+        self.signals.finished.emit(code, out, err)
+
+
+class _FinishSignals(QObject):
+    # Front image copies done, total
+    progress = pyqtSignal(int, int)
+    # Front image counts ({} if not run), amz_rename output, error message ("" on success)
+    finished = pyqtSignal(dict, str, str)
+
+
+class _FinishJob(QRunnable):
+    """Runs the post-sort steps (front images, then amz_rename) on a pool thread."""
+
+    def __init__(self, pt_output: str, front_image_folder: str | None):
+        super().__init__()
+        self.pt_output = pt_output
+        self.front_image_folder = front_image_folder
+        self.signals = _FinishSignals()
+
+    def run(self) -> None:
+        front, renamed, error = {}, "", ""
+        try:
+            if self.front_image_folder:
+                from front_image import copy_front_images
+
+                front = copy_front_images(self.front_image_folder, self.pt_output, self.signals.progress.emit)
+            import amz_rename
+
+            renamed = amz_rename.process_root(self.pt_output)
+        except Exception as exc:  # reported on the GUI thread
+            error = str(exc) or type(exc).__name__
+        self.signals.finished.emit(front, str(renamed or ""), error)
 
 
 class CombinedApp(QMainWindow):
@@ -51,6 +94,8 @@ class CombinedApp(QMainWindow):
         self.fetch_completed: bool = False
         self._pending_pt_output: str | None = None
         self._copy_front_images: bool = False
+        self._finish_job: _FinishJob | None = None
+        self._fetch_job: _FetchJob | None = None
 
         self._start_menu()
 
@@ -154,15 +199,26 @@ class CombinedApp(QMainWindow):
             self.front_image_label.setStyleSheet("color: red;")
 
     def _fetch_sku2asin(self) -> None:
-        result = subprocess.run([sys.executable, "fetch_sku2asin.py"], capture_output=True, text=True)
-        if result.returncode == 0:
+        # No double-clicks while the request is in flight
+        self.fetch_btn.setEnabled(False)
+        self.fetch_btn.setText("Fetching…")
+        job = _FetchJob()
+        job.signals.finished.connect(self._on_fetch_done)
+        # Keep the job (and its signals object) alive until it reports back
+        self._fetch_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_fetch_done(self, returncode: int, stdout: str, stderr: str) -> None:
+        self._fetch_job = None
+        self.fetch_btn.setText("Fetch sku2asin")
+        self.fetch_btn.setEnabled(True)
+        if returncode == 0:
             self.fetch_completed = True
-            message = result.stdout.strip() or "Done."
+            message = stdout.strip() or "Done."
             QMessageBox.information(self, "sku2asin fetch", message)
         else:
             self.fetch_completed = False
-            stderr = result.stderr.strip()
-            message = stderr or "fetch_sku2asin failed."
+            message = stderr.strip() or "fetch_sku2asin failed."
             QMessageBox.critical(self, "sku2asin fetch", message)
         self._update_start_enabled()
 
@@ -174,10 +230,16 @@ class CombinedApp(QMainWindow):
             QMessageBox.warning(self, "Input required", "Please choose an input folder before starting.")
             return
         self._copy_front_images = self.front_images_chk.isChecked()
+        # Sort keys memoised for a previous input tree are dead weight now
+        natural_key.cache_clear()
         self.resize(960, 800)
         if self.colours_sorted_chk.isChecked():
+            from order_phase import OrderPhase
+
             self._show_phase(OrderPhase, self._on_order_done)
         else:
+            from color_phase import ColorPhase
+
             self._show_phase(ColorPhase, self._on_colour_done)
 
     def _show_phase(self, phase_class, callback) -> None:
@@ -189,6 +251,8 @@ class CombinedApp(QMainWindow):
 
     def _on_colour_done(self, colour_output: str) -> None:
         self.input_folder = colour_output
+        from order_phase import OrderPhase
+
         self._show_phase(OrderPhase, self._on_order_done)
 
     def _on_order_done(self, pt_output: str | None = None) -> None:
@@ -206,19 +270,43 @@ class CombinedApp(QMainWindow):
         font.setBold(True)
         label.setFont(font)
         layout.addWidget(label)
+        # Shown once the front image copy reports progress
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
         self._set_central(processing)
 
     def _finish_processing(self) -> None:
         pt_output = self._pending_pt_output
-        if pt_output:
-            if self._copy_front_images and self.front_image_folder:
-                run_front_images(pt_output, self.front_image_folder, self)
-            try:
-                import amz_rename
-
-                amz_rename.run(pt_output)
-            except Exception as exc:  # pragma: no cover - defensive
-                QMessageBox.critical(self, "amz_rename error", str(exc))
+        if not pt_output:
+            self.close()
+            return
+        front_folder = self.front_image_folder if self._copy_front_images else None
+        job = _FinishJob(pt_output, front_folder)
+        job.signals.progress.connect(self._on_finish_progress)
+        job.signals.finished.connect(self._on_finish_done)
+        # Keep the job (and its signals object) alive until it reports back
+        self._finish_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_finish_progress(self, done: int, total: int) -> None:
+        self.progress_bar.setFormat("Front images: %v/%m")
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+        self.progress_bar.show()
+
+    def _on_finish_done(self, front: dict, renamed: str, error: str) -> None:
+        """One summary of every post-sort step, then close."""
+        self._finish_job = None
+        lines = []
+        if front:
+            lines.append(f"Front images copied: {front['copied']}, skipped: {front['skipped']}")
+        if error:
+            lines.append(f"Processing failed: {error}")
+            QMessageBox.critical(self, "Processing error", "\n".join(lines))
+        else:
+            lines.append(f"Renamed output: {renamed}" if renamed else "Processing complete.")
+            QMessageBox.information(self, "Processing complete", "\n".join(lines))
         self.close()
 
 
@@ -8,26 +8,42 @@ DATASET_ID = os.getenv("DATASET_ID")
 API_ID = os.getenv("API_ID")
 API_KEY = os.getenv("API_KEY")
 
+# One connection pool for both calls, so the data request reuses the
+# token request's TCP/TLS connection to api.domo.com
+session = requests.Session()
+
 # === STEP 2: Get OAuth token ===
 auth_url = "https://api.domo.com/oauth/token"
 data = {
     "grant_type": "client_credentials",
     "scope": "data"
 }
-auth_response = requests.post(auth_url, data=data, auth=(API_ID, API_KEY))
+auth_response = session.post(auth_url, data=data, auth=(API_ID, API_KEY))
 access_token = auth_response.json()["access_token"]
 
 # === STEP 3: Fetch dataset ===
 headers = {"Authorization": f"bearer {access_token}"}
 data_url = f"https://api.domo.com/v1/datasets/{DATASET_ID}/data?includeHeader=true"
-response = requests.get(data_url, headers=headers)
-
-if response.status_code != 200:
-    raise Exception(f"Failed to fetch dataset: {response.status_code} - {response.text}")
-
-# === Step 4: Save as CSV file ===
 output_file = "sku2asin.csv"
-with open(output_file, "w", encoding="utf-8") as f:
-    f.write(response.text)
+# Streamed: the CSV goes to disk in chunks as raw bytes, never held whole in memory
+with session.get(data_url, headers=headers, stream=True) as response:
+    if response.status_code != 200:
+        raise Exception(f"Failed to fetch dataset: {response.status_code} - {response.text}")
+
+    # === Step 4: Save as CSV file ===
+    # Written to a temp file and swapped in only once complete, so a dropped
+    # connection never replaces the last good CSV with a partial one
+    tmp_file = output_file + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
 
 print(f"Dataset saved as: {output_file}")
@@ -1,55 +1,121 @@
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
 import re
-from logic_utils import natural_key
+from logic_utils import fast_copy, natural_key
 
 
 # Accept common image extensions for front images
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff"}
+# Front images are looked up by colour name with one of these extensions
+_FRONT_EXTS = (".jpg", ".jpeg", ".png")
+# Concurrent front-image copies; the work is all file I/O, so scale past the
+# core count to keep an SSD's or SMB share's request queue busy
+_FRONT_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
-def copy_front_images(front_images_dir: str, root_dir: str) -> dict:
+def copy_front_images(
+    front_images_dir: str,
+    root_dir: str,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> dict:
     """
     For each model/producttype/colour.<ext> in front_images_dir,
     copy it into model/producttype/colour/MAIN.jpg in root_dir.
+    If given, progress(done, total) is called as copies finish (from this thread).
     Returns a dict with counts: {'copied': int, 'skipped': int}
     """
     copied = 0
     skipped = 0
     print(f"\n🔍 Copying front images from: {front_images_dir}")
     print(f"🔍 Into root directory: {root_dir}")
-    
-    for dirpath, _, files in os.walk(front_images_dir):
-        for fname in files:
-            name, ext = os.path.splitext(fname)
-            if ext.lower() not in {".jpg", ".jpeg", ".png"}:
-                continue
-            colour = name.strip()
-            rel = os.path.relpath(dirpath, front_images_dir).replace("\\", "/").strip("/")
-            target_dir = os.path.join(root_dir, rel, colour)
-            
-            print(f"  📁 Looking for: {target_dir}")
-            
-            if not os.path.isdir(target_dir):
-                print(f"  ⚠️  Directory not found, skipping: {colour}")
-                skipped += 1
-                continue
-            
-            src = os.path.join(dirpath, fname)
-            dst = os.path.join(target_dir, "MAIN.jpg")
-            
-            try:
-                shutil.copy2(src, dst)
-                print(f"  ✅ Copied {fname} -> {dst}")
-                copied += 1
-            except Exception as e:
-                print(f"  ❌ Failed to copy {fname}: {e}")
-                skipped += 1
+
+    # Copies are gathered per destination and run on a thread pool; two front
+    # images for the same colour (e.g. .jpg and .png) still copy in walk order.
+    jobs: Dict[str, List[Tuple[str, str]]] = {}
+    # Each target folder is stat'ed once, however many front images name it
+    known_dirs: Dict[str, bool] = {}
+    for dirpath, fname in _iter_front_files(front_images_dir):
+        name, ext = os.path.splitext(fname)
+        if not ext:  # e.g. a bare ".jpg"
+            continue
+        colour = name.strip()
+        rel = os.path.relpath(dirpath, front_images_dir).replace("\\", "/").strip("/")
+        target_dir = os.path.join(root_dir, rel, colour)
+        
+        print(f"  📁 Looking for: {target_dir}")
+        
+        exists = known_dirs.get(target_dir)
+        if exists is None:
+            exists = known_dirs[target_dir] = os.path.isdir(target_dir)
+        if not exists:
+            print(f"  ⚠️  Directory not found, skipping: {colour}")
+            skipped += 1
+            continue
+        
+        src = os.path.join(dirpath, fname)
+        dst = os.path.join(target_dir, "MAIN.jpg")
+        jobs.setdefault(dst, []).append((fname, src))
+
+    total = sum(map(len, jobs.values()))
+    done = 0
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(_FRONT_COPY_WORKERS, len(jobs))) as pool:
+            futures = [pool.submit(_copy_front_group, dst, group) for dst, group in jobs.items()]
+            for future in as_completed(futures):
+                for fname, dst, error in future.result():
+                    if error is None:
+                        print(f"  ✅ Copied {fname} -> {dst}")
+                        copied += 1
+                    else:
+                        print(f"  ❌ Failed to copy {fname}: {error}")
+                        skipped += 1
+                    done += 1
+                if progress is not None:
+                    progress(done, total)
     
     print(f"\n✨ Front images: {copied} copied, {skipped} skipped\n")
     return {'copied': copied, 'skipped': skipped}
+
+
+def _iter_front_files(folder: str) -> Iterator[Tuple[str, str]]:
+    """(dirpath, fname) for every candidate front image under *folder*, top-down.
+
+    Same traversal as os.walk (symlinked dirs are not entered, unreadable
+    dirs are skipped) but the entry types come from the scandir listing.
+    """
+    subdirs = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                # Cheap suffix test first; most files in the tree aren't front images
+                elif entry.name.lower().endswith(_FRONT_EXTS):
+                    yield folder, entry.name
+    except OSError:
+        return
+    for sub in subdirs:
+        yield from _iter_front_files(sub)
+
+
+def _copy_front_group(dst: str, group: List[Tuple[str, str]]) -> List[Tuple[str, str, Optional[Exception]]]:
+    """Copy each (fname, src) in *group* to *dst* in order; one result per copy."""
+    results = []
+    for fname, src in group:
+        try:
+            # MAIN.jpg is renamed downstream; its mtime/mode do not matter
+            fast_copy(src, dst, metadata=False)
+            results.append((fname, dst, None))
+        except Exception as e:
+            results.append((fname, dst, e))
+    return results
 """
 front_image.py
 
@@ -57,10 +123,13 @@ Logic for identifying and handling the 'front' image in a folder of product imag
 """
 
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff"}
+# Names that mark an image as the front one
+_FRONT_RE = re.compile(r"main|front|01", re.IGNORECASE)
 
 
 def is_image_file(p: Path) -> bool:
-    return p.is_file() and p.suffix.lower() in IMAGE_EXTS
+    # Suffix first: it rules most files out without a stat
+    return p.suffix.lower() in IMAGE_EXTS and p.is_file()
 
 
 def find_front_image(folder: Path) -> Optional[Path]:
@@ -68,15 +137,17 @@ def find_front_image(folder: Path) -> Optional[Path]:
     Returns the most likely 'front' image in the folder.
     Heuristic: prefers files named 'main', 'front', or '01', else first image by natural sort.
     """
-    candidates: List[Path] = [f for f in folder.iterdir() if is_image_file(f)]
+    # One scandir pass: entry types come from the listing, and only the
+    # winner is turned into a Path
+    with os.scandir(folder) as it:
+        candidates: List[os.DirEntry] = [
+            e for e in it if os.path.splitext(e.name)[1].lower() in IMAGE_EXTS and e.is_file()
+        ]
     if not candidates:
         return None
     # Prefer files with 'main', 'front', or '01' in name
-    preferred = [f for f in candidates if re.search(r"main|front|01", f.stem, re.IGNORECASE)]
-    if preferred:
-        # If multiple, pick the first by natural sort
-        preferred.sort(key=lambda p: natural_key(p.name))
-        return preferred[0]
-    # Otherwise, pick first by natural sort
-    candidates.sort(key=lambda p: natural_key(p.name))
-    return candidates[0]
+    preferred = [e for e in candidates if _FRONT_RE.search(os.path.splitext(e.name)[0])]
+    # Pick the first by natural sort; only the winner is needed, so min()
+    # keys each name once and skips the sort
+    winner = min(preferred or candidates, key=lambda e: natural_key(e.name))
+    return Path(winner.path)
@@ -1,8 +1,9 @@
 import json
 import os
-from typing import List, Optional
+import threading
+from typing import List
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QWidget,
@@ -17,30 +18,39 @@ from PyQt5.QtWidgets import (
 )
 
 from ui_utils import (
-    IMAGE_EXTS,
     ROW_PAD_Y,
     TARGET_FOLDER_NAMES,
+    THUMB_SIZE,
     ThumbItem,
+    ThumbLoader,
+    ThumbPrefetchJob,
+    is_image_name,
+    list_images,
     natural_key,
 )
 
 
+# Rows further than this many viewports from view release their pixmaps
+_KEEP_VIEWPORTS = 3
+
+
 class ItemRowWidget(QWidget):
-    """List row representing a single thumbnail entry."""
+    """List row representing a single thumbnail entry.
+
+    Rows are recycled across folders; bind() points one at another image.
+    """
 
     def __init__(self, item: ThumbItem, index: int, parent: QWidget | None = None):
         super().__init__(parent)
-        self.item = item
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(12)
 
-        thumb = item.load_thumb()
+        # Fixed-size placeholder; OrderPhase sets the pixmap once the row is near view
         self.image = QLabel()
-        self.image.setPixmap(thumb)
         self.image.setAlignment(Qt.AlignCenter)
-        self.image.setFixedSize(thumb.size())
+        self.image.setFixedSize(*THUMB_SIZE)
         layout.addWidget(self.image)
 
         meta = QWidget()
@@ -54,15 +64,26 @@ class ItemRowWidget(QWidget):
         self.index_label.setFont(font)
         meta_layout.addWidget(self.index_label)
 
-        meta_layout.addWidget(QLabel(f"orig: {item.orig_index} • {os.path.basename(item.path)}"))
+        self.meta_label = QLabel()
+        meta_layout.addWidget(self.meta_label)
         meta_layout.addStretch(1)
 
         layout.addWidget(meta, stretch=1)
+        self.bind(item, index)
+
+    def bind(self, item: ThumbItem, index: int) -> None:
+        self.item = item
+        self.meta_label.setText(f"orig: {item.orig_index} • {os.path.basename(item.path)}")
+        self.image.clear()
+        self.thumb_loaded = False
         self.update_index(index)
 
     def update_index(self, idx: int) -> None:
         self.index_label.setText(f"#{idx}")
 
+    def set_thumb(self, pixmap) -> None:
+        self.image.setPixmap(pixmap)
+
 
 class ReorderListWidget(QListWidget):
     orderChanged = pyqtSignal()
@@ -97,6 +118,21 @@ class OrderPhase(QWidget):
         self.vw_queue: List[str] = []
         self.vw_idx: int = -1
 
+        # Thumbnails decode off the GUI thread; rows waiting on one, by path
+        self.thumb_loader = ThumbLoader(self)
+        self.thumb_loader.loaded.connect(self._on_thumb_loaded)
+        self._pending_thumbs: dict[str, ItemRowWidget] = {}
+        # Rows currently holding (or loading) a thumbnail
+        self._realized_rows: set[int] = set()
+        # Scrolling emits a valueChanged per step; scan the rows once per event-loop turn
+        self._realize_timer = QTimer(self)
+        self._realize_timer.setSingleShot(True)
+        self._realize_timer.setInterval(0)
+        self._realize_timer.timeout.connect(self._realize_visible_thumbs)
+        self._prefetch_cancel: threading.Event | None = None
+        # Directory listings from the last queue scan, by path
+        self._dir_cache: dict[str, tuple[list[str], list[str], list[str]]] = {}
+
         self._build_ui()
         self._start_queue_from_root(root_dir)
 
@@ -127,6 +163,12 @@ class OrderPhase(QWidget):
 
         self.list_widget = ReorderListWidget()
         self.list_widget.orderChanged.connect(self._on_order_changed)
+        # A drop moves rows in the model; mirror just that move in self.items
+        self.list_widget.model().rowsMoved.connect(self._on_rows_moved)
+        # Thumbnails are decoded only for rows near the viewport
+        vbar = self.list_widget.verticalScrollBar()
+        vbar.valueChanged.connect(self._schedule_realize)
+        vbar.rangeChanged.connect(self._schedule_realize)
         layout.addWidget(self.list_widget, stretch=1)
 
         bottom = QHBoxLayout()
@@ -136,6 +178,7 @@ class OrderPhase(QWidget):
 
     # ------------------------------------------------------------------
     def _start_queue_from_root(self, root: str) -> None:
+        self._dir_cache = {}
         self.vw_queue = self._find_case_leafs(root)
         if not self.vw_queue:
             QMessageBox.information(self, "Not found", f"No '{TARGET_FOLDER_NAMES}' folders found under:\n{root}")
@@ -147,57 +190,200 @@ class OrderPhase(QWidget):
         self._update_progress_label()
 
     def _find_case_leafs(self, root: str) -> List[str]:
+        """Leaf folders to reorder: the naturally-first leaf under each target folder.
+
+        One os.scandir per directory (see _scan_dir) serves the walk, the
+        first-leaf descent and the image check alike; descents run inside the
+        walked tree, so their listings are reused rather than re-read.
+        """
         found: List[str] = []
-        for dirpath, _dirnames, _filenames in os.walk(root):
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            stack.extend(self._scan_dir(dirpath)[1])
             if os.path.basename(dirpath) in TARGET_FOLDER_NAMES:
-                leaf = self._first_leaf_dir(dirpath)
-                if leaf and self._has_images(leaf):
+                leaf = dirpath
+                while subdirs := self._scan_dir(leaf)[0]:
+                    leaf = os.path.join(leaf, subdirs[0])
+                if self._scan_dir(leaf)[2]:
                     found.append(os.path.normpath(leaf))
         seen = set()
         uniq = [p for p in found if not (p in seen or seen.add(p))]
         uniq.sort(key=natural_key)
+        # Only the queued leaves are read again (by _load_current)
+        cache = {os.path.normpath(path): listing for path, listing in self._dir_cache.items()}
+        self._dir_cache = {leaf: cache[leaf] for leaf in uniq if leaf in cache}
         return uniq
 
-    def _first_leaf_dir(self, start: str) -> Optional[str]:
-        cur = start
-        while True:
-            subs = [d for d in os.listdir(cur) if os.path.isdir(os.path.join(cur, d))]
-            subs.sort(key=natural_key)
-            if not subs:
-                return cur
-            cur = os.path.join(cur, subs[0])
-
-    def _has_images(self, path: str) -> bool:
-        try:
-            return any(os.path.splitext(f)[1].lower() in IMAGE_EXTS for f in os.listdir(path))
-        except FileNotFoundError:
-            return False
+    def _scan_dir(self, path: str) -> tuple[list[str], list[str], list[str]]:
+        """(subdir names, subdir paths the walk enters, image names) of *path*; names natural-sorted.
+
+        Memoised in self._dir_cache for the current root.
+        """
+        cached = self._dir_cache.get(path)
+        if cached is None:
+            subdirs: list[str] = []
+            walk_dirs: list[str] = []
+            images: list[str] = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            subdirs.append(entry.name)
+                            # Like os.walk, list symlinked dirs but don't enter them
+                            if not entry.is_symlink():
+                                walk_dirs.append(entry.path)
+                        elif is_image_name(entry.name) and entry.is_file():
+                            images.append(entry.name)
+            except OSError:
+                pass
+            # Sorted once here; the prefetch and _load_current both reuse the order
+            subdirs.sort(key=natural_key)
+            images.sort(key=natural_key)
+            cached = self._dir_cache[path] = (subdirs, walk_dirs, images)
+        return cached
 
     def _load_current(self) -> None:
+        # Stop warming the old "next" folder before competing with it for the disk
+        self._cancel_prefetch()
         path = self.vw_queue[self.vw_idx]
         self.dir_path = path
-        files = sorted(
-            [f for f in os.listdir(path) if os.path.splitext(f)[1].lower() in IMAGE_EXTS],
-            key=natural_key,
-        )
+        # Drop thumbnails still in flight for the previous folder
+        self.thumb_loader.reset()
+        self._pending_thumbs.clear()
+        self._realized_rows.clear()
+        # The leaf was listed while building the queue; use that listing once
+        cached = self._dir_cache.pop(path, None)
+        files = cached[2] if cached is not None else list_images(path)
         self.items = [ThumbItem(os.path.join(path, f), i) for i, f in enumerate(files)]
         self._render_list()
         self.status.setText(f"Loaded {len(self.items)} images")
+        self._prefetch_folder(self.vw_idx + 1)
+
+    def _prefetch_folder(self, idx: int) -> None:
+        """Warm up the thumbnails of queued folder *idx* in the background."""
+        self._cancel_prefetch()
+        if idx >= len(self.vw_queue):
+            return
+        path = self.vw_queue[idx]
+        cached = self._dir_cache.get(path)
+        self._prefetch_cancel = threading.Event()
+        names = cached[2] if cached is not None else None
+        QThreadPool.globalInstance().start(ThumbPrefetchJob(path, self._prefetch_cancel, names))
+
+    def _cancel_prefetch(self) -> None:
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
 
     def _render_list(self) -> None:
-        self.list_widget.clear()
-        for idx, item in enumerate(self.items):
-            widget = ItemRowWidget(item, idx)
-            list_item = QListWidgetItem()
-            list_item.setSizeHint(widget.sizeHint())
-            self.list_widget.addItem(list_item)
-            self.list_widget.setItemWidget(list_item, widget)
+        """Show self.items, rebinding the existing rows and only adding or removing the difference."""
+        view = self.list_widget
+        view.setUpdatesEnabled(False)
+        try:
+            while view.count() > len(self.items):
+                # The view deletes the row's widget along with the item
+                view.takeItem(view.count() - 1)
+            for idx, item in enumerate(self.items):
+                if idx < view.count():
+                    widget = view.itemWidget(view.item(idx))
+                    if isinstance(widget, ItemRowWidget):
+                        widget.bind(item, idx)
+                        continue
+                    view.takeItem(idx)
+                widget = ItemRowWidget(item, idx)
+                list_item = QListWidgetItem()
+                list_item.setSizeHint(widget.sizeHint())
+                view.insertItem(idx, list_item)
+                view.setItemWidget(list_item, widget)
+        finally:
+            view.setUpdatesEnabled(True)
+        view.scrollToTop()
+        # Item rects are only known after the view lays the rows out
+        self._schedule_realize()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._schedule_realize()
+
+    def _schedule_realize(self, *_args) -> None:
+        """Run _realize_visible_thumbs once the current burst of scroll/layout events is handled."""
+        if not self._realize_timer.isActive():
+            self._realize_timer.start()
+
+    def _realize_visible_thumbs(self, *_args) -> None:
+        """Request thumbnails for rows within one viewport height of the visible area.
+
+        Cached pixmaps are shown at once; the rest are decoded on the thread
+        pool and land in _on_thumb_loaded. Rows scrolled far away drop their
+        pixmap again (QPixmapCache still has it).
+        """
+        if not self.isVisible():
+            return
+        view = self.list_widget
+        height = view.viewport().height()
+        lo, hi = -height, 2 * height
+        for row in range(view.count()):
+            list_item = view.item(row)
+            rect = view.visualItemRect(list_item)
+            if rect.top() > hi:
+                break
+            if rect.bottom() < lo:
+                continue
+            widget = view.itemWidget(list_item)
+            if isinstance(widget, ItemRowWidget) and not widget.thumb_loaded:
+                widget.thumb_loaded = True
+                self._realized_rows.add(row)
+                pixmap = widget.item.cached_thumb()
+                if pixmap is not None:
+                    widget.set_thumb(pixmap)
+                else:
+                    self._pending_thumbs[widget.item.path] = widget
+                    self.thumb_loader.request(widget.item.path)
+
+        far_lo, far_hi = -_KEEP_VIEWPORTS * height, (_KEEP_VIEWPORTS + 1) * height
+        for row in list(self._realized_rows):
+            list_item = view.item(row)
+            widget = view.itemWidget(list_item) if list_item is not None else None
+            if not isinstance(widget, ItemRowWidget) or not widget.thumb_loaded:
+                self._realized_rows.discard(row)
+                continue
+            rect = view.visualItemRect(list_item)
+            if rect.top() > far_hi or rect.bottom() < far_lo:
+                self._realized_rows.discard(row)
+                self._pending_thumbs.pop(widget.item.path, None)
+                widget.image.clear()
+                widget.item.thumb = None
+                widget.thumb_loaded = False
+
+    def _on_thumb_loaded(self, results: list) -> None:
+        viewport = self.list_widget.viewport()
+        # One repaint for the whole batch
+        viewport.setUpdatesEnabled(False)
+        try:
+            for path, pixmap in results:
+                widget = self._pending_thumbs.pop(path, None)
+                if widget is None:
+                    continue
+                widget.item.set_thumb(pixmap)
+                try:
+                    widget.set_thumb(pixmap)
+                except RuntimeError:
+                    # The row widget was deleted (e.g. replaced by a drag-and-drop move)
+                    pass
+        finally:
+            viewport.setUpdatesEnabled(True)
 
     def _mapping_original_to_desired(self) -> list[int]:
-        inv = [None] * len(self.items)
+        # Plain int list with a -1 sentinel; the gap check is then one C-level scan
+        inv = [-1] * len(self.items)
         for new_pos, it in enumerate(self.items):
             inv[it.orig_index] = new_pos
-        if any(i is None for i in inv):
+        if -1 in inv:
             raise ValueError("Invalid mapping: None value encountered in mapping. This indicates a bug in the mapping logic or input data.")
         return inv
 
@@ -214,15 +400,33 @@ class OrderPhase(QWidget):
         else:
             self.lbl_dir.setText(self.dir_path or "No folder selected")
 
-    def _on_order_changed(self) -> None:
-        new_items: list[ThumbItem] = []
-        for row in range(self.list_widget.count()):
-            list_item = self.list_widget.item(row)
-            widget = self.list_widget.itemWidget(list_item)
+    def _on_rows_moved(self, _parent, start: int, end: int, _dest, row: int) -> None:
+        """Rotate the moved block of self.items into place.
+
+        *row* is the destination in pre-move coordinates (as for
+        beginMoveRows), so only items between the old and new position shift.
+        """
+        items = self.items
+        block = items[start:end + 1]
+        if row > end:
+            lo, hi = start, row - 1
+            items[start:row] = items[end + 1:row] + block
+        elif row < start:
+            lo, hi = row, end
+            items[row:end + 1] = block + items[row:start]
+        else:
+            return
+        # Rows outside the shifted span keep their position, label and thumbnail
+        view = self.list_widget
+        self._realized_rows.difference_update(range(lo, hi + 1))
+        for r in range(lo, hi + 1):
+            widget = view.itemWidget(view.item(r))
             if isinstance(widget, ItemRowWidget):
-                widget.update_index(row)
-                new_items.append(widget.item)
-        self.items = new_items
+                widget.update_index(r)
+                if widget.thumb_loaded:
+                    self._realized_rows.add(r)
+
+    def _on_order_changed(self) -> None:
         self.status.setText("Reordered items")
 
     def next_model_confirm(self) -> None:
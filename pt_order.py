@@ -6,9 +6,8 @@ import uuid
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from logic_utils import natural_key
+from logic_utils import LINK_MODES, natural_key, place_file
 from datetime import datetime
-import shutil
 import inspect
 
 """
@@ -16,7 +15,7 @@ pt_order.py — fast + safe PT renamer
 
 Exposes:
     run_with_map(root, pt_map, apply_changes=True, *,
-                 dry_run_log=True, allow_parallel=True) -> int
+                 dry_run_log=True, allow_parallel=True, link_mode="hardlink") -> str
 
 - root: str | Path to the project root
 - pt_map: dict[str, list[int]] where keys are base folders (e.g. "Brand/Model/VintageWallet")
@@ -25,6 +24,9 @@ Exposes:
 - apply_changes: if False, dry-run (no mutations).
 - dry_run_log: if True, prints what would happen in dry-run.
 - allow_parallel: if True, plans each leaf concurrently (renames still per-leaf).
+- link_mode: how renamed files are placed in the output tree (logic_utils.LINK_MODES).
+  Hard links cost no data I/O and fall back to a copy across filesystems; later
+  steps only rename output files or replace them with new ones.
 
 Perf notes:
 - Uses os.walk/scandir for fewer syscalls.
@@ -48,7 +50,8 @@ def _list_images(dirpath: str) -> List[str]:
                 for e in it
                 if e.is_file()
                 and (INCLUDE_HIDDEN or not e.name.startswith("."))
-                and os.path.splitext(e.name)[1].lower() in IMAGE_EXTS
+                and (dot := e.name.rfind(".")) > 0
+                and e.name[dot:].lower() in IMAGE_EXTS
             ]
     except FileNotFoundError:
         return []
@@ -106,8 +109,15 @@ def _plan_pairs_for_leaf(root: str, leaf: str, mapping: List[int]) -> List[Tuple
         raise RuntimeError(f"Duplicate target names in '{rel}'. Check mapping.")
     return pairs
 
-def _two_phase_rename(pairs: List[Tuple[str, str]], input_root: str, output_root: str, apply: bool, log: bool):
-    """Copy renamed files to Outputs/timestamp instead of renaming in place."""
+def _two_phase_rename(
+    pairs: List[Tuple[str, str]],
+    input_root: str,
+    output_root: str,
+    apply: bool,
+    log: bool,
+    link_mode: str = "hardlink",
+):
+    """Place renamed files under Outputs/timestamp instead of renaming in place."""
     if not pairs:
         return
 
@@ -115,10 +125,22 @@ def _two_phase_rename(pairs: List[Tuple[str, str]], input_root: str, output_root
         # Preserve full input structure under Outputs/timestamp
         rel_path = os.path.relpath(src, input_root)
         out_dir = os.path.join(output_root, os.path.dirname(rel_path))
-        os.makedirs(out_dir, exist_ok=True)
         dst_name = os.path.basename(final_dst)
         out_path = os.path.join(out_dir, dst_name)
-        shutil.copy2(src, out_path)
+        if not apply:
+            # Dry-run: report the placement, write nothing
+            if log:
+                print(f"DRY-RUN {src} -> {out_path}")
+            continue
+        os.makedirs(out_dir, exist_ok=True)
+        place_file(src, out_path, link_mode)
+
+def _paths_nest(a: str, b: str) -> bool:
+    """True if a and b are the same directory or one contains the other."""
+    try:
+        return os.path.commonpath([a, b]) in (a, b)
+    except ValueError:  # different drives on Windows
+        return False
 
 def _norm_map_keys(pt_map: Dict[str, List[int]]) -> Dict[str, List[int]]:
     out: Dict[str, List[int]] = {}
@@ -135,10 +157,13 @@ def run_with_map(
     *,
     dry_run_log: bool = True,
     allow_parallel: bool = True,
+    link_mode: str = "hardlink",
 ) -> str:
     """
     Returns: output folder path.
     """
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"link_mode must be one of {LINK_MODES}, not {link_mode!r}")
     root_path = Path(root).resolve()
     root_str = str(root_path)
     norm = _norm_map_keys(pt_map)
@@ -177,10 +202,17 @@ def run_with_map(
     # Perform renames per-leaf (sequential keeps it simple/safe)
     script_dir = os.path.dirname(__file__)
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    output_root = os.path.join(script_dir, "Outputs", timestamp)
-    os.makedirs(output_root, exist_ok=True)
+    output_root = base_root = os.path.abspath(os.path.join(script_dir, "Outputs", timestamp))
+    # root may itself be an output made this same second (e.g. by colour_sorter);
+    # never write into the tree being read.
+    n = 1
+    while _paths_nest(output_root, root_str):
+        output_root = f"{base_root}-{n}"
+        n += 1
+    if apply_changes:
+        os.makedirs(output_root, exist_ok=True)
     acted = 0
     for leaf, pairs in results:
-        _two_phase_rename(pairs, root_str, output_root, apply=bool(apply_changes), log=dry_run_log)
+        _two_phase_rename(pairs, root_str, output_root, apply=bool(apply_changes), log=dry_run_log, link_mode=link_mode)
         acted += 1
     return output_root
@@ -15,6 +15,233 @@ def test_amz_rename_smoke():
     assert callable(process_root)
 
 
+def test_load_sku2asin_csv_resolves_columns(tmp_path, monkeypatch):
+    import amz_rename
+    from amz_rename import _load_sku2asin_csv
+
+    monkeypatch.setattr(amz_rename, "_CACHE_DIR", tmp_path / "cache")
+
+    (tmp_path / "sku2asin.csv").write_text(
+        "ASIN,Title,SKU\n"
+        "b0test1234,Thing, Apple iPhone 17 Black \n"
+        "NOTANASIN,Bad,apple iphone 17 brown\n"
+        "B0SHORTROW\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    mapping = _load_sku2asin_csv()
+    assert mapping == {"apple iphone 17 black": "B0TEST1234"}
+
+    # Cached until the file changes
+    assert _load_sku2asin_csv() is mapping
+    (tmp_path / "sku2asin.csv").write_text("sku,asin\nother sku,B0OTHER123\n", encoding="utf-8")
+    assert _load_sku2asin_csv() == {"other sku": "B0OTHER123"}
+
+    # '/' in a CSV SKU is reachable through the hyphenated folder form
+    (tmp_path / "sku2asin.csv").write_text(
+        "sku,asin\na/b c,B0SLASH123\na/b-c,B0MIXED123\n", encoding="utf-8"
+    )
+    mapping = _load_sku2asin_csv()
+    assert mapping["a-b c"] == "B0SLASH123"
+    assert "a-b-c" not in mapping
+
+
+def test_load_sku2asin_csv_uses_disk_cache(tmp_path, monkeypatch):
+    import pickle
+
+    import amz_rename
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(amz_rename, "_CACHE_DIR", cache_dir)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sku2asin.csv").write_text("sku,asin\nsome sku,B0DISK1234\n", encoding="utf-8")
+    assert amz_rename._load_sku2asin_csv() == {"some sku": "B0DISK1234"}
+    (cached,) = cache_dir.glob("sku2asin-*.pkl")
+    assert f"-v{amz_rename._CACHE_VERSION}-" in cached.name
+
+    # A pickle from another cache format is ignored and pruned on rewrite
+    legacy = cached.with_name(cached.name.replace(f"v{amz_rename._CACHE_VERSION}-", ""))
+    legacy.write_bytes(pickle.dumps({"some sku": "B0STALE123"}))
+    cached.unlink()
+    amz_rename._parse_sku2asin_csv.cache_clear()
+    assert amz_rename._load_sku2asin_csv() == {"some sku": "B0DISK1234"}
+    assert list(cache_dir.glob("sku2asin-*.pkl")) == [cached]
+
+    # A fresh process (empty in-memory cache) is served from the pickle
+    amz_rename._parse_sku2asin_csv.cache_clear()
+    monkeypatch.setattr(amz_rename, "_read_sku2asin_csv", None)
+    assert amz_rename._load_sku2asin_csv() == {"some sku": "B0DISK1234"}
+
+
+def test_process_root_closes_walker_on_error(tmp_path, monkeypatch):
+    import pytest
+
+    import amz_rename
+
+    leaf = tmp_path / "root" / "Brand" / "Model" / "Black"
+    leaf.mkdir(parents=True)
+    for idx in range(1, 6):
+        (leaf / f"PT0{idx}.jpg").write_bytes(b"x")
+    (tmp_path / "sku2asin.csv").write_text("sku,asin\nbrand model black,B0TEST1234\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(amz_rename, "_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(amz_rename, "__file__", str(tmp_path / "amz_rename.py"))
+
+    walkers = []
+    file_walker = amz_rename._FileWalker
+
+    def tiny_walker(root):
+        # A one-slot queue keeps the producer blocked until it is closed
+        walkers.append(file_walker(root, maxsize=1))
+        return walkers[-1]
+
+    monkeypatch.setattr(amz_rename, "_FileWalker", tiny_walker)
+
+    def broken_check(entry):
+        raise OSError("device went away")
+
+    monkeypatch.setattr(amz_rename, "should_rename", broken_check)
+    with pytest.raises(OSError):
+        amz_rename.process_root(tmp_path / "root")
+    walkers[0]._thread.join(timeout=2)
+    assert not walkers[0]._thread.is_alive()
+
+
+def test_rename_noreplace_never_clobbers(tmp_path):
+    from amz_rename import _rename_noreplace
+
+    src, target = tmp_path / "a.jpg", tmp_path / "b.jpg"
+    src.write_bytes(b"a")
+    target.write_bytes(b"b")
+    assert not _rename_noreplace(src, target)
+    assert src.read_bytes() == b"a" and target.read_bytes() == b"b"
+
+    target.unlink()
+    assert _rename_noreplace(src, target)
+    assert not src.exists() and target.read_bytes() == b"a"
+
+
+def test_rename_noreplace_fallbacks(tmp_path, monkeypatch):
+    import errno
+
+    import pytest
+
+    import amz_rename
+
+    src, target = tmp_path / "a.jpg", tmp_path / "b.jpg"
+    src.write_bytes(b"a")
+
+    # Source removal fails after linking: the link is dropped again
+    real_unlink = os.unlink
+
+    def locked_unlink(path, *args, **kwargs):
+        if os.fspath(path) == str(src):
+            raise PermissionError(errno.EACCES, "in use", str(path))
+        return real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "unlink", locked_unlink)
+    with pytest.raises(PermissionError):
+        amz_rename._rename_noreplace(src, target)
+    assert src.read_bytes() == b"a" and not target.exists()
+    monkeypatch.setattr(os, "unlink", real_unlink)
+
+    # No hard links on this filesystem: check-then-replace
+    def no_links(*_args):
+        raise OSError(errno.EPERM, "links not supported")
+
+    monkeypatch.setattr(os, "link", no_links)
+    assert amz_rename._rename_noreplace(src, target)
+    assert not src.exists() and target.read_bytes() == b"a"
+    src.write_bytes(b"c")
+    assert not amz_rename._rename_noreplace(src, target)
+
+    # Any other link error is a real failure
+    def denied(*_args):
+        raise PermissionError(errno.EACCES, "denied")
+
+    monkeypatch.setattr(os, "link", denied)
+    with pytest.raises(PermissionError):
+        amz_rename._rename_noreplace(src, tmp_path / "c.jpg")
+
+
+def test_main_accepts_verbose_anywhere(monkeypatch):
+    import amz_rename
+
+    calls = []
+    monkeypatch.setattr(amz_rename, "process_root", lambda root, verbose: calls.append((root, verbose)))
+    for argv in (["-v", "Inputs"], ["Inputs", "--verbose"], ["Inputs"]):
+        monkeypatch.setattr(amz_rename.sys, "argv", ["amz_rename.py", *argv])
+        amz_rename.main()
+    assert calls == [("Inputs", True), ("Inputs", True), ("Inputs", False)]
+
+
+def test_derive_sku_from_file(tmp_path):
+    from amz_rename import derive_sku_from_file
+
+    root = tmp_path / "root"
+    assert derive_sku_from_file(root / "Apple" / "iPhone 17" / "Black" / "MAIN.jpg", root) == "Apple iPhone 17 Black"
+    assert derive_sku_from_file(root / "a" / "b" / "c" / "d" / "e" / "MAIN.jpg", root) == "b c d e"
+    assert derive_sku_from_file(root / "MAIN.jpg", root) == ""
+
+
+def test_should_rename_extensions(tmp_path):
+    from amz_rename import should_rename
+
+    for name in ("a.jpg", "b.JPEG", "c.Tiff", "d.webp"):
+        (tmp_path / name).write_bytes(b"")
+        assert should_rename(tmp_path / name)
+    for name in ("e.txt", ".jpg", "f.jpg.bak"):
+        (tmp_path / name).write_bytes(b"")
+        assert not should_rename(tmp_path / name)
+    (tmp_path / "dir.png").mkdir()
+    assert not should_rename(tmp_path / "dir.png")
+
+
+def test_sanitize_for_windows():
+    from amz_rename import sanitize_for_windows
+
+    assert sanitize_for_windows(' Apple  iPhone<17>: "Pro"/Max\\|?*\t Black ') == "Apple iPhone17 ProMax Black"
+
+
+def test_parse_variant_forms():
+    from amz_rename import _parse_variant
+
+    assert _parse_variant("apple x.pt03.jpg") == ("PT03", "jpg")
+    assert _parse_variant("PT02.jpeg") == ("PT02", "jpeg")
+    assert _parse_variant("MAIN.tar.png") == ("MAIN", "png")
+    assert _parse_variant("B0TEST1234.MAIN.webp") == ("MAIN", "webp")
+    assert _parse_variant("photo.jpg") is None
+    assert _parse_variant("a.b.PT01.x.jpg") == ("PT01", "x.jpg")
+    assert _parse_variant(".MAIN.jpg") is None
+    assert _parse_variant("sku.MAIN.") is None
+    assert _parse_variant("sku.PT1.jpg") is None
+
+
+def test_is_asin_named_matches_regex_skip():
+    from amz_rename import _ASIN_RE, _NAME_RE, _is_asin_named
+
+    names = [
+        "B0TEST1234.MAIN.jpg", "b0test1234.pt02.png", "1234567890.PT10.webp",
+        "ABCDEFGHIJ.xyz.MAIN.jpg", "apple-x-bl.MAIN.jpg", "B0TEST1234.PTx2.jpg",
+        "B0TEST123.MAIN.jpg", "B0TEST1234.MAIN", "ÀBCDEFGHIJ.MAIN.jpg",
+    ]
+    for name in names:
+        m = _NAME_RE.match(name)
+        expected = bool(m and _ASIN_RE.match(m.group(1)))
+        assert _is_asin_named(name) is expected, name
+
+
+def test_pack_bins_respects_capacity():
+    from amz_rename import _pack_bins
+
+    files = [(f"f{i}", size) for i, size in enumerate([7, 5, 4, 3, 3, 2, 12])]
+    bins = _pack_bins(files, 10)
+    assert sorted(name for b in bins for name, _ in b) == sorted(name for name, _ in files)
+    assert [("f6", 12)] in bins  # oversized file sits alone
+    assert all(sum(size for _, size in b) <= 10 for b in bins if len(b) > 1)
+    assert len(bins) == 4
+
+
 if __name__ == "__main__":
     # Only create test CSV when running directly (not during pytest collection)
     csv_path = os.path.join(repo_dir, "sku2asin.csv")
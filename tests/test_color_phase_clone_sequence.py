@@ -7,17 +7,36 @@ pytest.importorskip("PyQt5.QtWidgets")
 from PyQt5.QtWidgets import QApplication
 
 import color_phase
+import ui_utils
+
+
+_APP = None
 
 
 def _ensure_app():
+    global _APP
     app = QApplication.instance()
     if app is None:
         # Use the offscreen platform to avoid GUI requirements in tests
         os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
         app = QApplication([])
+    # Keep a reference so the application isn't garbage-collected mid-test
+    _APP = app
     return app
 
 
+def _drain_thumbs(app, phase):
+    """Wait for pending thumbnail decodes and their (throttled) delivery."""
+    import time
+
+    from PyQt5.QtCore import QThreadPool
+
+    QThreadPool.globalInstance().waitForDone()
+    deadline = time.monotonic() + 2
+    while phase._pending_thumbs and time.monotonic() < deadline:
+        app.processEvents()
+
+
 def _create_image(path):
     img = Image.new("RGB", (32, 32), color=(255, 0, 0))
     img.save(path)
@@ -32,9 +51,8 @@ def test_clone_removed_from_colour_sequence(monkeypatch, tmp_path):
 
     for idx in range(6):
         _create_image(leaf / f"img_{idx}.png")
-
-    output_root = tmp_path / "outputs"
-    monkeypatch.setattr(color_phase, "get_output_root", lambda _base: str(output_root))
+    # Anything colour_sorter writes lands under tmp_path, not the repo's Outputs/
+    monkeypatch.setattr(color_phase.colour_sorter, "__file__", str(tmp_path / "colour_sorter.py"))
 
     phase = color_phase.ColorPhase(str(root), lambda _path: None)
 
@@ -53,3 +71,278 @@ def test_clone_removed_from_colour_sequence(monkeypatch, tmp_path):
     phase._set_clone_item(None)
     reverted = [item.assigned_color for item in phase.items[:6]]
     assert reverted == ["Blue", "Black", "Green", "Blue", "Black", "Green"]
+
+
+def test_loading_leaf_writes_no_output(monkeypatch, tmp_path):
+    _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    for idx in range(3):
+        _create_image(leaf / f"img_{idx}.png")
+
+    before = sorted(tmp_path.rglob("*"))
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    # colour_sorter writes the output once the batch completes
+    assert sorted(tmp_path.rglob("*")) == before
+    assert phase.btn_next.isEnabled()
+
+
+def test_apply_colors_updates_rows_in_place(monkeypatch, tmp_path):
+    _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    for idx in range(3):
+        _create_image(leaf / f"img_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    rows = list(phase.row_widgets)
+
+    phase.color_entries[0].setText("Red")
+    phase.apply_colors()
+    phase._set_clone_item(phase.items[1])
+
+    assert phase.row_widgets == rows
+    assert rows[0].badge_label.text().strip() == "Red"
+    assert rows[1].clone_btn.isChecked() and rows[1].badge_label.text().strip() == "Clone"
+    assert not rows[0].clone_btn.isChecked()
+
+
+def test_thumbnails_load_for_visible_rows_only(monkeypatch, tmp_path):
+    app = _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    for idx in range(40):
+        _create_image(leaf / f"img_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    assert not any(row.thumb_loaded for row in phase.row_widgets)
+
+    phase.resize(600, 400)
+    phase.show()
+    app.processEvents()
+    loaded = [row.thumb_loaded for row in phase.row_widgets]
+    assert loaded[0] and not loaded[-1]
+    # Badge style sheets are applied as rows come near the viewport
+    assert phase.row_widgets[0].badge_label.styleSheet()
+    assert not phase.row_widgets[-1].badge_label.styleSheet()
+
+    bar = phase.scroll_area.verticalScrollBar()
+    assert bar.singleStep() * 3 >= color_phase.THUMB_SIZE[1]
+    bar.setValue(bar.maximum())
+    # Scroll updates are coalesced into one scan on the next event-loop turn
+    assert not phase.row_widgets[-1].thumb_loaded
+    app.processEvents()
+    assert phase.row_widgets[-1].thumb_loaded
+    assert phase.row_widgets[-1].badge_label.styleSheet()
+    # Rows scrolled far out of view give their pixmaps back
+    assert not phase.row_widgets[0].thumb_loaded
+    assert phase.row_widgets[0].item.thumb is None
+    phase.close()
+
+
+def test_thumbnails_decode_off_thread_and_drop_stale(monkeypatch, tmp_path):
+    from PyQt5.QtGui import QImage
+
+    app = _ensure_app()
+
+    for leaf_name in ("a", "b"):
+        leaf = tmp_path / "root" / leaf_name
+        leaf.mkdir(parents=True)
+        for idx in range(2):
+            _create_image(leaf / f"{leaf_name}_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    phase.show()
+    app.processEvents()
+    _drain_thumbs(app, phase)
+    assert all(row.img_label.pixmap() and not row.img_label.pixmap().isNull() for row in phase.row_widgets)
+
+    # A result from the previous leaf must not land on the rebound rows
+    stale_generation = phase.thumb_loader.generation
+    phase._load_leaf(1)
+    app.processEvents()
+    pending = dict(phase._pending_thumbs)
+    phase.thumb_loader._on_done(stale_generation, phase.items[0].path, QImage())
+    assert phase._pending_thumbs == pending
+    _drain_thumbs(app, phase)
+    assert not phase._pending_thumbs
+    assert all(row.item.thumb is not None for row in phase.row_widgets)
+    phase.close()
+
+
+def test_clone_button_selects_its_row(monkeypatch, tmp_path):
+    _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    for idx in range(3):
+        _create_image(leaf / f"img_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    phase.row_widgets[2].clone_btn.click()
+    assert phase._current_clone_name() == "img_2.png"
+    phase.row_widgets[2].clone_btn.click()
+    assert phase._current_clone_name() == ""
+
+
+def test_clone_clicks_coalesce_into_one_apply(monkeypatch, tmp_path):
+    import time
+
+    app = _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    for idx in range(3):
+        _create_image(leaf / f"img_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    applied = []
+    monkeypatch.setattr(phase, "_sync_rows", applied.append)
+    for row in phase.row_widgets:
+        row.clone_btn.click()
+    assert phase._current_clone_name() == "img_2.png"
+    assert applied == []
+
+    deadline = time.monotonic() + 2
+    while not applied and time.monotonic() < deadline:
+        app.processEvents()
+    assert applied == ["img_2.png"]
+
+
+def test_rows_reused_across_leaves(monkeypatch, tmp_path):
+    _ensure_app()
+
+    for leaf_name, count in (("a", 3), ("b", 2)):
+        leaf = tmp_path / "root" / leaf_name
+        leaf.mkdir(parents=True)
+        for idx in range(count):
+            _create_image(leaf / f"{leaf_name}_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    rows = list(phase.row_widgets)
+    assert len(rows) == 3
+
+    phase._load_leaf(1)
+    assert phase.row_widgets == rows[:2]
+    assert [row.name_label.text() for row in phase.row_widgets] == ["b_0.png", "b_1.png"]
+    assert all(row.item is item for row, item in zip(phase.row_widgets, phase.items))
+
+
+def test_resizing_colour_entries_keeps_text(monkeypatch, tmp_path):
+    _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    _create_image(leaf / "img_0.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    first = phase.color_entries[0]
+    phase.num_colors.setValue(5)
+    assert len(phase.color_entries) == 5 and phase.color_entries[0] is first
+    assert phase._get_sequence() == ["Black", "Brown", "Navy"]
+
+    phase.num_colors.setValue(2)
+    assert phase._get_sequence() == ["Black", "Brown"]
+
+
+def test_clone_row_highlight_uses_property(monkeypatch, tmp_path):
+    _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    for idx in range(2):
+        _create_image(leaf / f"img_{idx}.png")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    phase._set_clone_item(phase.items[1])
+    assert [row.property("isClone") for row in phase.row_widgets] == [False, True]
+    assert all(row.styleSheet() == "" for row in phase.row_widgets)
+
+
+def test_next_leaf_is_prefetched(monkeypatch, tmp_path):
+    from PyQt5.QtCore import QThreadPool
+
+    _ensure_app()
+
+    for leaf_name in ("a", "b"):
+        leaf = tmp_path / "root" / leaf_name
+        leaf.mkdir(parents=True)
+        _create_image(leaf / f"{leaf_name}.png")
+    warmed = []
+    # Thumbnail jobs left over from earlier tests must not see the stub
+    QThreadPool.globalInstance().waitForDone()
+    monkeypatch.setattr(ui_utils, "load_thumb_image", warmed.append)
+
+    color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    QThreadPool.globalInstance().waitForDone()
+    assert warmed == [str(tmp_path / "root" / "b" / "b.png")]
+
+
+def test_next_model_records_leaf_colours(monkeypatch, tmp_path):
+    _ensure_app()
+
+    for leaf_name in ("a", "b"):
+        leaf = tmp_path / "root" / leaf_name
+        leaf.mkdir(parents=True)
+        for idx in range(3):
+            _create_image(leaf / f"{leaf_name}_{idx}.png")
+    monkeypatch.setattr(color_phase.colour_sorter, "__file__", str(tmp_path / "colour_sorter.py"))
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    phase.color_entries[0].setText("Red")
+    phase.next_model()
+    assert phase.leaf_idx == 1
+    assert phase.col_map["a"][0] == "Red"
+
+
+def test_large_leaf_rows_created_in_chunks(monkeypatch, tmp_path):
+    app = _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    count = color_phase._ROW_CHUNK * 2 + 5
+    for idx in range(count):
+        (leaf / f"img_{idx}.png").write_bytes(b"")
+
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), lambda _path: None)
+    assert len(phase.items) == count
+    assert len(phase.row_widgets) == color_phase._ROW_CHUNK
+
+    for _ in range(10):
+        app.processEvents()
+    assert [row.item for row in phase.row_widgets] == phase.items
+
+
+def test_batch_sort_runs_off_the_gui_thread(monkeypatch, tmp_path):
+    import threading
+    import time
+
+    from PyQt5.QtCore import QThreadPool
+
+    app = _ensure_app()
+
+    leaf = tmp_path / "root" / "leaf"
+    leaf.mkdir(parents=True)
+    _create_image(leaf / "img_0.png")
+    sorted_on = []
+
+    def fake_run_with_map(root, col_map, **_kwargs):
+        sorted_on.append(threading.current_thread())
+        return str(tmp_path / "sorted")
+
+    monkeypatch.setattr(color_phase.colour_sorter, "run_with_map", fake_run_with_map)
+    monkeypatch.setattr(color_phase.QMessageBox, "information", lambda *_args: None)
+    done = []
+    phase = color_phase.ColorPhase(str(tmp_path / "root"), done.append)
+    phase.next_model()
+    assert not phase.btn_next.isEnabled()
+
+    QThreadPool.globalInstance().waitForDone()
+    deadline = time.monotonic() + 2
+    while not done and time.monotonic() < deadline:
+        app.processEvents()
+    assert done == [str(tmp_path / "sorted")]
+    assert sorted_on and sorted_on[0] is not threading.main_thread()
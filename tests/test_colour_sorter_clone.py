@@ -37,3 +37,52 @@ def test_clone_image_copies_to_all_colours(tmp_path):
             for d in dirnames:
                 Path(dirpath, d).rmdir()
         output_path.rmdir()
+
+
+def test_link_modes_place_files(tmp_path):
+    import shutil
+
+    import pytest
+
+    root = tmp_path / "Root"
+    leaf = root / "Model" / "Case"
+    leaf.mkdir(parents=True)
+    for idx in range(2):
+        (leaf / f"{idx:02d}.jpg").write_bytes(b"img%d" % idx)
+    col_map = {"Model/Case": ["Red", "Blue"]}
+
+    for mode in ("hardlink", "reflink", "copy"):
+        output_path = Path(run_with_map(root, col_map, link_mode=mode))
+        try:
+            placed = output_path / "Model" / "Case" / "Blue" / "01.jpg"
+            assert placed.read_bytes() == b"img1"
+            shared = os.stat(placed).st_ino == os.stat(leaf / "01.jpg").st_ino
+            assert shared is (mode == "hardlink")
+        finally:
+            shutil.rmtree(output_path)
+
+    with pytest.raises(ValueError):
+        run_with_map(root, col_map, link_mode="symlink")
+
+
+def test_iter_images_filters_and_sorts(tmp_path):
+    from colour_sorter import _iter_images
+
+    for name in ("img10.JPG", "img2.png", "img1.jpeg", "notes.txt", ".hidden.png", "_skip.jpg", "noext"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "folder.png").mkdir()
+    assert [p.name for p in _iter_images(tmp_path)] == ["img1.jpeg", "img2.png", "img10.JPG"]
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    root = tmp_path / "Root"
+    leaf = root / "Model" / "DryRun"
+    leaf.mkdir(parents=True)
+    for idx in range(3):
+        (leaf / f"{idx:02d}.jpg").write_bytes(b"test")
+
+    output_path = Path(
+        run_with_map(root, {"Model/DryRun": ["Red", "Blue"]}, apply_changes=False, clone_map={"Model/DryRun": "00.jpg"})
+    )
+    assert not (output_path / "Model" / "DryRun").exists()
+    assert sorted(p.name for p in leaf.iterdir()) == ["00.jpg", "01.jpg", "02.jpg"]
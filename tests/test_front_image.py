@@ -79,5 +79,24 @@ def _direct_run():
         print(f"\nCleaned up: {temp_front}")
 
 
+def test_copy_front_images_counts_and_destinations(tmp_path):
+    front = tmp_path / "front" / "Apple" / "iPhone 17"
+    front.mkdir(parents=True)
+    (front / "Black.jpg").write_bytes(b"black")
+    (front / "Blue.png").write_bytes(b"blue")
+    (front / "Green.jpg").write_bytes(b"green")
+    (front / "notes.txt").write_bytes(b"")
+    root = tmp_path / "root" / "Apple" / "iPhone 17"
+    for colour in ("Black", "Blue"):
+        (root / colour).mkdir(parents=True)
+
+    progress = []
+    result = copy_front_images(str(tmp_path / "front"), str(tmp_path / "root"), lambda *p: progress.append(p))
+    assert result == {"copied": 2, "skipped": 1}
+    assert sorted(progress) == [(1, 2), (2, 2)]
+    assert (root / "Black" / "MAIN.jpg").read_bytes() == b"black"
+    assert (root / "Blue" / "MAIN.jpg").read_bytes() == b"blue"
+
+
 if __name__ == '__main__':
     _direct_run()
@@ -0,0 +1,69 @@
+import os
+
+from logic_utils import fast_copy
+
+
+def test_fast_copy_copies_data_and_mtime(tmp_path):
+    src = tmp_path / "src.jpg"
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    src.write_bytes(data)
+    os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+    dst = tmp_path / "dst.jpg"
+    assert fast_copy(src, dst) == dst
+    assert dst.read_bytes() == data
+    assert os.stat(dst).st_mtime_ns == os.stat(src).st_mtime_ns
+
+    plain = tmp_path / "plain.jpg"
+    fast_copy(src, plain, reflink=False)
+    assert plain.read_bytes() == data
+
+    bare = tmp_path / "bare.jpg"
+    fast_copy(src, bare, metadata=False)
+    assert bare.read_bytes() == data
+    assert os.stat(bare).st_mtime_ns != os.stat(src).st_mtime_ns
+
+
+def test_fast_copy_fallbacks(tmp_path, monkeypatch):
+    import logic_utils
+
+    src = tmp_path / "src.jpg"
+    data = os.urandom(1024 * 1024 + 5)
+    src.write_bytes(data)
+    monkeypatch.setattr(logic_utils, "_ficlone", lambda *_: False)
+    monkeypatch.setattr(logic_utils, "_copy_range", lambda *_: False)
+    fast_copy(src, tmp_path / "sendfile.jpg")
+    assert (tmp_path / "sendfile.jpg").read_bytes() == data
+
+    monkeypatch.setattr(logic_utils, "_sendfile", lambda *_: False)
+    fast_copy(src, tmp_path / "readinto.jpg")
+    assert (tmp_path / "readinto.jpg").read_bytes() == data
+
+
+def test_natural_key_orders_numbers_numerically():
+    from logic_utils import natural_key
+
+    names = ["img10.jpg", "IMG2.jpg", "img1.jpg", "a", "img2b.jpg"]
+    assert sorted(names, key=natural_key) == ["a", "img1.jpg", "IMG2.jpg", "img2b.jpg", "img10.jpg"]
+    assert natural_key("PT03.png") == ("pt", 3, ".png")
+    assert natural_key("PT03.png") is natural_key("PT03.png")
+
+
+def test_link_or_copy_never_writes_through_link(tmp_path):
+    from logic_utils import link_or_copy
+
+    src = tmp_path / "src.jpg"
+    src.write_bytes(b"original")
+    dst = tmp_path / "dst.jpg"
+    link_or_copy(src, dst)
+    assert dst.read_bytes() == b"original"
+    assert os.stat(dst).st_ino == os.stat(src).st_ino
+
+    other = tmp_path / "other.jpg"
+    other.write_bytes(b"replacement")
+    fast_copy(other, dst)
+    assert dst.read_bytes() == b"replacement"
+    assert src.read_bytes() == b"original"
+
+    link_or_copy(src, tmp_path / "copy.jpg", link=False)
+    assert os.stat(tmp_path / "copy.jpg").st_ino != os.stat(src).st_ino
@@ -0,0 +1,171 @@
+import os
+
+import pytest
+from PIL import Image
+
+pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtWidgets import QApplication
+
+import order_phase
+
+_APP = None
+
+
+def _ensure_app():
+    global _APP
+    app = QApplication.instance()
+    if app is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication([])
+    _APP = app
+    return app
+
+
+def _drain_thumbs(app, phase):
+    """Wait for pending thumbnail decodes and their (throttled) delivery."""
+    import time
+
+    from PyQt5.QtCore import QThreadPool
+
+    QThreadPool.globalInstance().waitForDone()
+    deadline = time.monotonic() + 2
+    while phase._pending_thumbs and time.monotonic() < deadline:
+        app.processEvents()
+
+
+def _make_leaf(root, count):
+    leaf = root / "Apple" / "iPhone 17" / "VintageWallet" / "Black"
+    leaf.mkdir(parents=True)
+    for idx in range(count):
+        Image.new("RGB", (32, 32), color=(idx, 0, 0)).save(leaf / f"img_{idx}.png")
+    return leaf
+
+
+def _rows(phase):
+    view = phase.list_widget
+    return [view.itemWidget(view.item(row)) for row in range(view.count())]
+
+
+def test_thumbnails_load_for_visible_rows_only(tmp_path):
+    app = _ensure_app()
+    _make_leaf(tmp_path, 40)
+
+    phase = order_phase.OrderPhase(str(tmp_path))
+    assert not any(row.thumb_loaded for row in _rows(phase))
+
+    phase.resize(600, 400)
+    phase.show()
+    app.processEvents()
+    loaded = [row.thumb_loaded for row in _rows(phase)]
+    assert loaded[0] and not loaded[-1]
+
+    bar = phase.list_widget.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    app.processEvents()
+    assert _rows(phase)[-1].thumb_loaded
+    assert not _rows(phase)[0].thumb_loaded
+    phase.close()
+
+
+def test_thumbnails_arrive_from_thread_pool(tmp_path):
+    app = _ensure_app()
+    _make_leaf(tmp_path, 3)
+
+    phase = order_phase.OrderPhase(str(tmp_path))
+    phase.show()
+    app.processEvents()
+    _drain_thumbs(app, phase)
+    assert not phase._pending_thumbs
+    assert all(row.image.pixmap() and not row.image.pixmap().isNull() for row in _rows(phase))
+    phase.close()
+
+
+def test_find_case_leafs_picks_first_leaf_with_images(tmp_path, monkeypatch):
+    _ensure_app()
+    _make_leaf(tmp_path, 1)
+    (tmp_path / "Apple" / "iPhone 17" / "VintageWallet" / "White").mkdir()
+    empty = tmp_path / "Apple" / "iPhone 16" / "ShinyCase" / "Blue"
+    empty.mkdir(parents=True)
+    (empty / "notes.txt").write_text("x")
+    (tmp_path / "Other" / "folder").mkdir(parents=True)
+
+    scanned = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(order_phase.os, "scandir", lambda p: scanned.append(p) or real_scandir(p))
+
+    phase = order_phase.OrderPhase(str(tmp_path))
+    leaf = os.path.normpath(tmp_path / "Apple" / "iPhone 17" / "VintageWallet" / "Black")
+    assert phase.vw_queue == [leaf]
+    assert [os.path.basename(it.path) for it in phase.items] == ["img_0.png"]
+    # Every directory, including the loaded leaf, is listed once
+    assert len(scanned) == len(set(scanned))
+    assert not phase._dir_cache
+
+
+def test_drop_rotates_only_the_moved_span(tmp_path):
+    from PyQt5.QtCore import QModelIndex
+
+    app = _ensure_app()
+    _make_leaf(tmp_path, 5)
+    phase = order_phase.OrderPhase(str(tmp_path))
+    phase.show()
+    app.processEvents()
+
+    model = phase.list_widget.model()
+    # Same model move a drag-and-drop performs: row 1 dropped before row 4
+    rows = _rows(phase)
+    rows[0].index_label.setText("untouched")
+    assert model.moveRows(QModelIndex(), 1, 1, QModelIndex(), 4)
+    assert rows[0].index_label.text() == "untouched"
+    rows[0].update_index(0)
+    assert [it.orig_index for it in phase.items] == [0, 2, 3, 1, 4]
+    assert [row.item for row in _rows(phase)] == phase.items
+
+    assert model.moveRows(QModelIndex(), 4, 1, QModelIndex(), 1)
+    assert [it.orig_index for it in phase.items] == [0, 4, 2, 3, 1]
+    assert [row.index_label.text() for row in _rows(phase)] == [f"#{i}" for i in range(5)]
+    assert phase._mapping_original_to_desired() == [0, 4, 2, 3, 1]
+    phase.close()
+
+
+def test_next_folder_is_prefetched(tmp_path, monkeypatch):
+    from PyQt5.QtCore import QThreadPool
+
+    import ui_utils
+
+    _ensure_app()
+    _make_leaf(tmp_path, 1)
+    other = tmp_path / "Apple" / "iPhone 18" / "ShinyCase" / "Red"
+    other.mkdir(parents=True)
+    Image.new("RGB", (8, 8)).save(other / "b.png")
+    warmed = []
+    # Thumbnail jobs left over from earlier tests must not see the stub
+    QThreadPool.globalInstance().waitForDone()
+    monkeypatch.setattr(ui_utils, "load_thumb_image", warmed.append)
+
+    order_phase.OrderPhase(str(tmp_path))
+    QThreadPool.globalInstance().waitForDone()
+    assert warmed == [os.path.join(os.path.normpath(other), "b.png")]
+
+
+def test_rows_reused_across_folders(tmp_path):
+    app = _ensure_app()
+    _make_leaf(tmp_path, 3)
+    other = tmp_path / "Apple" / "iPhone 18" / "ShinyCase" / "Red"
+    other.mkdir(parents=True)
+    for idx in range(2):
+        Image.new("RGB", (8, 8)).save(other / f"b_{idx}.png")
+
+    phase = order_phase.OrderPhase(str(tmp_path))
+    phase.show()
+    app.processEvents()
+    first_rows = _rows(phase)
+    assert first_rows[0].thumb_loaded
+
+    phase.next_model_confirm()
+    rows = _rows(phase)
+    assert rows == first_rows[:2]
+    assert [row.item for row in rows] == phase.items
+    assert [os.path.basename(row.item.path) for row in rows] == ["b_0.png", "b_1.png"]
+    assert not any(row.thumb_loaded for row in rows)
+    phase.close()
@@ -1,4 +1,7 @@
 import os
+
+import pytest
+
 from pt_order import run_with_map
 
 # Define the input folder and mapping
@@ -10,6 +13,45 @@ root_folder = os.path.join(repo_dir, "Inputs")
 # Mapping key is relative path from Inputs
 pt_map = {"Google/Pixel 9a/VintageWallet": [0, 5, 4, 2, 3, 1]}
 
+
+def test_outputs_are_hard_links_by_default(tmp_path, monkeypatch):
+    import pt_order
+
+    leaf = tmp_path / "Brand" / "Model" / "VintageWallet" / "Black"
+    leaf.mkdir(parents=True)
+    # Outputs/ is made beside the module; keep it under tmp_path
+    monkeypatch.setattr(pt_order, "__file__", str(tmp_path / "out" / "pt_order.py"))
+    for idx in range(3):
+        (leaf / f"img_{idx}.jpg").write_bytes(b"x" * (idx + 1))
+
+    out = run_with_map(str(tmp_path), {"Brand/Model/VintageWallet": [2, 0, 1]})
+    out_leaf = os.path.join(out, "Brand", "Model", "VintageWallet", "Black")
+    src = os.stat(leaf / "img_0.jpg")
+    dst = os.stat(os.path.join(out_leaf, "PT04.jpg"))
+    assert dst.st_size == src.st_size
+    if dst.st_dev == src.st_dev:
+        assert os.path.samestat(src, dst)
+
+    copied = run_with_map(str(tmp_path), {"Brand/Model/VintageWallet": [2, 0, 1]}, link_mode="copy")
+    dst = os.stat(os.path.join(copied, "Brand", "Model", "VintageWallet", "Black", "PT04.jpg"))
+    assert not os.path.samestat(src, dst)
+
+    with pytest.raises(ValueError):
+        run_with_map(str(tmp_path), {}, link_mode="symlink")
+
+
+
+def test_dry_run_writes_nothing(tmp_path, capsys):
+    leaf = tmp_path / "Brand" / "Model" / "ShinyCase" / "Red"
+    leaf.mkdir(parents=True)
+    for idx in range(2):
+        (leaf / f"img_{idx}.jpg").write_bytes(b"x")
+
+    out = run_with_map(str(tmp_path), {"Brand/Model/ShinyCase": [1, 0]}, apply_changes=False)
+    assert not os.path.exists(os.path.join(out, "Brand", "Model", "ShinyCase"))
+    assert "PT03.jpg" in capsys.readouterr().out
+
+
 if __name__ == "__main__":
     # Run pt_order with the mapping
     run_with_map(root_folder, pt_map, apply_changes=True, dry_run_log=False, allow_parallel=False)
@@ -0,0 +1,125 @@
+import os
+
+import pytest
+from PIL import Image
+
+pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtWidgets import QApplication
+
+from ui_utils import THUMB_SIZE, ThumbItem
+
+_APP = None
+
+
+def _ensure_app():
+    global _APP
+    app = QApplication.instance()
+    if app is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication([])
+    _APP = app
+    return app
+
+
+def test_thumb_fits_thumb_size(tmp_path):
+    _ensure_app()
+
+    wide = tmp_path / "wide.jpg"
+    Image.new("RGB", (800, 400), color=(0, 128, 255)).save(wide)
+    thumb = ThumbItem(str(wide), 0).load_thumb()
+    assert (thumb.width(), thumb.height()) == (THUMB_SIZE[0], THUMB_SIZE[1] // 2)
+
+    tall = tmp_path / "tall.png"
+    Image.new("RGB", (21, 41)).save(tall)
+    from ui_utils import _decode_thumb_image_pil
+
+    item = ThumbItem(str(tall), 0)
+    assert item.load_thumb().size() == _decode_thumb_image_pil(str(tall)).size()
+
+    # JPEGs shrink while decoding; the result still fits THUMB_SIZE
+    big = tmp_path / "big.jpg"
+    Image.new("RGB", (4000, 3000), color=(10, 200, 30)).save(big)
+    image = _decode_thumb_image_pil(str(big))
+    assert (image.width(), image.height()) == (THUMB_SIZE[0], THUMB_SIZE[1] * 3 // 4)
+
+
+def test_thumb_disk_cache_roundtrip(tmp_path, monkeypatch):
+    import ui_utils
+
+    _ensure_app()
+    cache_dir = tmp_path / "thumbs"
+    monkeypatch.setattr(ui_utils, "THUMB_CACHE_DIR", str(cache_dir))
+
+    img = tmp_path / "img.jpg"
+    Image.new("RGB", (400, 400), color=(10, 200, 10)).save(img)
+    first = ui_utils.load_thumb_image(str(img))
+    # The entry is written in the background; the writer runs jobs in order
+    ui_utils._THUMB_CACHE_WRITER.submit(lambda: None).result()
+    assert len(list(cache_dir.glob("*.png"))) == 1
+
+    # Served from disk without decoding the source again
+    monkeypatch.setattr(ui_utils, "_decode_thumb_image", None)
+    second = ThumbItem(str(img), 0).load_thumb()
+    assert second.size() == first.size()
+
+    # A fresh entry is never rewritten, and no temp files are left behind
+    (cached,) = cache_dir.iterdir()
+    os.utime(cached, ns=(5, 5))
+    ui_utils._save_thumb_cache(first, str(cached))
+    assert os.stat(cached).st_mtime_ns == 5
+    assert [p.suffix for p in cache_dir.iterdir()] == [".png"]
+
+    ui_utils.prune_thumb_cache(0)
+    assert not list(cache_dir.glob("*.png"))
+
+
+def test_list_images_filters_and_sorts(tmp_path):
+    from ui_utils import list_images
+
+    for name in ("img10.JPG", "img2.png", "img1.jpeg", "notes.txt", ".jpg", ".hidden.png"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "folder.png").mkdir()
+    assert list_images(str(tmp_path)) == [".hidden.png", "img1.jpeg", "img2.png", "img10.JPG"]
+
+
+def test_thumb_refreshed_when_file_changes(tmp_path, monkeypatch):
+    import ui_utils
+
+    _ensure_app()
+    monkeypatch.setattr(ui_utils, "THUMB_CACHE_DIR", str(tmp_path / "thumbs"))
+    img = tmp_path / "img.png"
+    Image.new("RGB", (80, 80)).save(img)
+    assert ThumbItem(str(img), 0).load_thumb().width() == 80
+
+    Image.new("RGB", (80, 40)).save(img)
+    os.utime(img, ns=(1, 1))
+    assert ThumbItem(str(img), 0).load_thumb().height() == 40
+
+
+def test_thumb_loader_batches_results(tmp_path, monkeypatch):
+    import time
+
+    import ui_utils
+    from PyQt5.QtCore import QThreadPool
+
+    app = _ensure_app()
+    monkeypatch.setattr(ui_utils, "THUMB_CACHE_DIR", str(tmp_path / "thumbs"))
+    paths = []
+    for idx in range(4):
+        path = tmp_path / f"img_{idx}.png"
+        Image.new("RGB", (40, 40)).save(path)
+        paths.append(str(path))
+
+    loader = ui_utils.ThumbLoader()
+    batches = []
+    loader.loaded.connect(batches.append)
+    for path in paths:
+        loader.request(path)
+    QThreadPool.globalInstance().waitForDone()
+    deadline = time.monotonic() + 2
+    while sum(map(len, batches)) < len(paths) and time.monotonic() < deadline:
+        app.processEvents()
+    # The first result goes out on its own, the rest of the burst together
+    assert sorted(path for batch in batches for path, _ in batch) == paths
+    assert len(batches) == 2
+    assert all(not pixmap.isNull() for batch in batches for _, pixmap in batch)
@@ -10,16 +10,22 @@ of duplicating code across scripts.
 from __future__ import annotations
 
 import os
-import re
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Iterable, List, Optional
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
 from PIL import Image
 
+from logic_utils import natural_key  # re-exported for the UI phases
+
 # --------- shared constants ---------
 IMAGE_EXTS: set[str] = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff"}
+# Same set without the dots, for matching name.rpartition(".")[2]
+_IMAGE_EXT_NAMES: frozenset[str] = frozenset(e.lstrip(".") for e in IMAGE_EXTS)
 THUMB_SIZE: tuple[int, int] = (80, 80)
 ROW_PAD_Y: int = 6
 
@@ -30,15 +36,29 @@ TARGET_FOLDER_NAMES = ["VintageWallet", "ShinyWallet", "VintWallet", "ShinyCase"
 INSERT_LINE_PAD: int = 3       # gap before/after row for the insertion line
 INSERT_LINE_HEIGHT: int = 4    # thickness of the insertion line
 
+# Decoded thumbnails are shared app-wide through QPixmapCache (limit in KiB)
+THUMB_CACHE_KB: int = 100 * 1024
+QPixmapCache.setCacheLimit(THUMB_CACHE_KB)
 
-# --------- generic helpers ---------
-def natural_key(name: str):
-    """Return a key for natural sorting where numbers are ordered numerically."""
-    return [int(s) if s.isdigit() else s.lower() for s in re.split(r"(\d+)", name)]
+# Pre-scaled thumbnails persist across sessions here, pruned to a byte budget
+THUMB_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "amz-image-tool", "thumbs")
+THUMB_CACHE_MAX_BYTES: int = 200 * 1024 * 1024
 
+# Minimum gap between batches of decoded thumbnails handed to the UI (~10 Hz)
+THUMB_FLUSH_MS: int = 100
+_thumb_prune_started = False
+# PNG-encoding a cache entry costs about as much as the decode it saves, so
+# one background thread writes them in order while the loaders move on.
+_THUMB_CACHE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thumb-cache")
 
+
+# --------- generic helpers ---------
+@lru_cache(maxsize=128)
 def pastel_for_name(name: str) -> str:
-    """Deterministic pastel colour for a given text label (hex string)."""
+    """Deterministic pastel colour for a given text label (hex string).
+
+    Memoised: the same few colour names are looked up for every row.
+    """
     if not name:
         return "#dddddd"
     h = int(hashlib.sha1(name.strip().lower().encode("utf-8")).hexdigest()[:6], 16)
@@ -59,56 +79,259 @@ class ThumbItem:
         self.path = path
         self.name = os.path.basename(path)
         self.orig_index = orig_index
-        self.thumb = None  # lazily created PhotoImage
+        self.thumb = None  # lazily created QPixmap
+        self._stat: Optional[os.stat_result] = None
         # Optional field used by the colour planner
         self.assigned_color: str = ""
 
     def load_thumb(self):
-        """Load and cache a Qt-compatible thumbnail from disk."""
+        """Load and cache a Qt-compatible thumbnail from disk.
+
+        Pixmaps are also kept in QPixmapCache, so a new ThumbItem for the same
+        file (e.g. revisiting a folder) skips the decode. The key includes the
+        file's mtime and size, so an edited image is never served stale.
+        """
+        if self.cached_thumb() is None:
+            self.set_thumb(QPixmap.fromImage(load_thumb_image(self.path, self._stat)))
+        return self.thumb
+
+    def cached_thumb(self) -> Optional[QPixmap]:
+        """The thumbnail if it is already in memory (here or in QPixmapCache), else None."""
         if self.thumb is None:
-            img = Image.open(self.path)
-            img.thumbnail(THUMB_SIZE, Image.LANCZOS)
-            mode = img.mode
-            if mode not in ("RGB", "RGBA"):
-                if mode in ("LA", "P"):
-                    img = img.convert("RGBA")
-                else:
-                    img = img.convert("RGB")
-                mode = img.mode
-
-            if mode == "RGBA":
-                data = img.tobytes("raw", "RGBA")
-                self._image_data = data  # Keep buffer alive for QImage
-                qimage = QImage(
-                    self._image_data,
-                    img.width,
-                    img.height,
-                    QImage.Format_RGBA8888,
-                )
-            else:  # RGB
-                if mode != "RGB":
-                    img = img.convert("RGB")
-                data = img.tobytes("raw", "RGB")
-                self._image_data = data  # Keep buffer alive for QImage
-                qimage = QImage(
-                    self._image_data,
-                    img.width,
-                    img.height,
-                    QImage.Format_RGB888,
-                )
-
-            pixmap = QPixmap.fromImage(qimage.copy())
-            if not pixmap.isNull():
-                self.thumb = pixmap.scaled(
-                    THUMB_SIZE[0],
-                    THUMB_SIZE[1],
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-            else:
-                self.thumb = QPixmap()
+            cached = QPixmapCache.find(self._cache_key())
+            if cached is not None and not cached.isNull():
+                self.thumb = cached
         return self.thumb
 
+    def set_thumb(self, pixmap: QPixmap) -> None:
+        """Store a thumbnail produced elsewhere (e.g. by ThumbLoader)."""
+        self.thumb = pixmap
+        QPixmapCache.insert(self._cache_key(), pixmap)
+
+    def _cache_key(self) -> str:
+        try:
+            self._stat = st = os.stat(self.path)
+            stamp = f"{st.st_mtime_ns}|{st.st_size}"
+        except OSError:
+            self._stat = None
+            stamp = ""
+        return f"{self.path}|{stamp}|{THUMB_SIZE[0]}x{THUMB_SIZE[1]}"
+
+
+class _ThumbSignals(QObject):
+    done = pyqtSignal(int, str, QImage)
+
+
+class _ThumbJob(QRunnable):
+    def __init__(self, signals: _ThumbSignals, generation: int, path: str):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.path = path
+
+    def run(self) -> None:
+        try:
+            image = load_thumb_image(self.path)
+        except Exception:
+            image = QImage()
+        self.signals.done.emit(self.generation, self.path, image)
+
+
+class ThumbLoader(QObject):
+    """Decodes thumbnails on QThreadPool and hands them back on the GUI thread.
+
+    Results are delivered in batches through ``loaded`` (a list of
+    ``(path, QPixmap)``), at most every THUMB_FLUSH_MS: the first result after
+    a quiet spell goes out at once, the rest of a burst is coalesced so the
+    view repaints a few times a second rather than once per image.
+
+    Call reset() when the displayed folder changes; results requested before
+    that are dropped instead of landing on rows that now show other images.
+    """
+
+    loaded = pyqtSignal(list)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.generation = 0
+        self._ready: list[tuple[str, QImage]] = []
+        self._signals = _ThumbSignals()
+        # Queued to this (GUI) thread since the signals object lives here
+        self._signals.done.connect(self._on_done)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(THUMB_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def reset(self) -> None:
+        self.generation += 1
+        self._ready.clear()
+
+    def request(self, path: str) -> None:
+        QThreadPool.globalInstance().start(_ThumbJob(self._signals, self.generation, path))
+
+    def _on_done(self, generation: int, path: str, image: QImage) -> None:
+        if generation != self.generation:
+            return
+        self._ready.append((path, image))
+        if not self._flush_timer.isActive():
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._ready:
+            return
+        ready, self._ready = self._ready, []
+        # Hold off the next batch for one interval
+        self._flush_timer.start()
+        # QPixmap may only be created on the GUI thread
+        self.loaded.emit([(path, QPixmap.fromImage(image)) for path, image in ready])
+
+
+class ThumbPrefetchJob(QRunnable):
+    """Best-effort warm-up of the next leaf's disk-cached thumbnails.
+
+    Runs while the user works on the current leaf; *cancel* is checked
+    between files so a stale prefetch stops as soon as a new leaf loads.
+    *names* are the leaf's image names when the caller already listed it.
+    """
+
+    def __init__(self, leaf_dir: str, cancel: threading.Event, names: Iterable[str] | None = None):
+        super().__init__()
+        self.leaf_dir = leaf_dir
+        self.cancel = cancel
+        self.names = names
+
+    def run(self) -> None:
+        try:
+            names = list_images(self.leaf_dir) if self.names is None else self.names
+            for name in names:
+                if self.cancel.is_set():
+                    return
+                load_thumb_image(os.path.join(self.leaf_dir, name))
+        except OSError:
+            # The leaf reports any error itself when it is loaded
+            pass
+
+
+# QImage (unlike QPixmap) may be created off the GUI thread, so the decode and
+# disk-cache helpers below are safe to call from worker threads.
+def load_thumb_image(path: str, st: os.stat_result | None = None) -> QImage:
+    """Read *path*'s thumbnail from the on-disk cache, decoding and saving it on a miss.
+
+    *st* is the file's stat result when the caller already has it.
+    """
+    cache_path = _thumb_cache_path(path, st)
+    if cache_path is None:
+        return _decode_thumb_image(path)
+    qimage = QImage()
+    if qimage.load(cache_path, "PNG"):
+        return qimage
+    qimage = _decode_thumb_image(path)
+    if not qimage.isNull():
+        _THUMB_CACHE_WRITER.submit(_save_thumb_cache, qimage, cache_path)
+    return qimage
+
+
+def _save_thumb_cache(qimage: QImage, cache_path: str) -> None:
+    """Write *qimage* to the disk cache unless another thread already has.
+
+    The image goes to a private temp file first and is renamed into place, so
+    concurrent loaders (thumbnail pool, prefetch) never read a partial PNG.
+    """
+    if os.path.exists(cache_path):
+        return
+    tmp = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        if not qimage.save(tmp, "PNG"):
+            raise OSError(f"could not write {tmp}")
+        os.replace(tmp, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return
+    _start_thumb_cache_prune()
+
+
+def _decode_thumb_image(path: str) -> QImage:
+    # QImageReader decodes straight to the target size (libjpeg scales in
+    # the DCT domain), so large JPEGs are never fully decoded.
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(THUMB_SIZE[0], THUMB_SIZE[1], Qt.KeepAspectRatio))
+        qimage = reader.read()
+        if not qimage.isNull():
+            return qimage
+    return _decode_thumb_image_pil(path)
+
+
+def _decode_thumb_image_pil(path: str) -> QImage:
+    """Fallback for formats the Qt image plugins can't read."""
+    img = Image.open(path)
+    # Let libjpeg scale while decoding (a no-op for other formats); BILINEAR
+    # is indistinguishable from LANCZOS at thumbnail size and much cheaper.
+    img.draft("RGB", (THUMB_SIZE[0] * 2, THUMB_SIZE[1] * 2))
+    img.thumbnail(THUMB_SIZE, Image.BILINEAR)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if img.mode in ("LA", "P") else "RGB")
+    if img.mode == "RGBA":
+        fmt, channels = QImage.Format_RGBA8888, 4
+    else:
+        fmt, channels = QImage.Format_RGB888, 3
+    data = img.tobytes("raw", img.mode)
+    # Explicit bytes-per-line (rows aren't 32-bit aligned); copy() detaches
+    # the image from the Python-owned buffer.
+    qimage = QImage(data, img.width, img.height, channels * img.width, fmt).copy()
+    if qimage.isNull():
+        return QImage()
+    return qimage.scaled(THUMB_SIZE[0], THUMB_SIZE[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _thumb_cache_path(path: str, st: os.stat_result | None = None) -> Optional[str]:
+    """Cache file for *path*'s thumbnail, keyed on its location, mtime and size."""
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{THUMB_SIZE[0]}x{THUMB_SIZE[1]}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(THUMB_CACHE_DIR, f"{digest}.png")
+
+
+def _start_thumb_cache_prune() -> None:
+    """Prune the thumbnail cache once per session on a background thread."""
+    global _thumb_prune_started
+    if _thumb_prune_started:
+        return
+    _thumb_prune_started = True
+    threading.Thread(target=prune_thumb_cache, daemon=True).start()
+
+
+def prune_thumb_cache(max_bytes: int | None = None) -> None:
+    """Delete the least recently written thumbnails until the cache fits *max_bytes*."""
+    budget = THUMB_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries: list[tuple[int, int, str]] = []
+    try:
+        for e in os.scandir(THUMB_CACHE_DIR):
+            if e.is_file():
+                st = e.stat()
+                entries.append((st.st_mtime_ns, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
 
 # --------- filesystem helpers ---------
 def find_leaf_dirs(top_dir: str) -> list[str]:
@@ -116,19 +339,31 @@ def find_leaf_dirs(top_dir: str) -> list[str]:
     results: list[str] = []
     for root, dirs, files in os.walk(top_dir):
         if not dirs:  # leaf = no subdirectories
-            if any(os.path.splitext(f)[1].lower() in IMAGE_EXTS for f in files):
+            if any(map(is_image_name, files)):
                 results.append(root)
     # natural sort by relative path
     results.sort(key=lambda p: natural_key(os.path.relpath(p, top_dir)))
     return results
 
 
+def is_image_name(name: str) -> bool:
+    """True if *name* has a supported image extension (same rules as os.path.splitext)."""
+    stem, _, ext = name.rpartition(".")
+    return bool(stem.lstrip(".")) and ext.lower() in _IMAGE_EXT_NAMES
+
+
+def list_images(path: str) -> list[str]:
+    """Natural-sorted names of the image files directly inside *path*."""
+    with os.scandir(path) as it:
+        names = [e.name for e in it if is_image_name(e.name) and e.is_file()]
+    names.sort(key=natural_key)
+    return names
+
+
 def has_images(path: str) -> bool:
     """True if directory contains at least one supported image file."""
     try:
-        for f in os.listdir(path):
-            if os.path.splitext(f)[1].lower() in IMAGE_EXTS:
-                return True
+        return any(map(is_image_name, os.listdir(path)))
     except FileNotFoundError:
         return False
     return False